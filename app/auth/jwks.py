@@ -0,0 +1,147 @@
+"""Cognito JWKS key store: chaves parseadas uma vez por rotação, refresh assíncrono."""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import requests as http_requests
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+logger = logging.getLogger(__name__)
+
+JWKS_CACHE_TTL = 3600
+# kid desconhecido: não volta ao Cognito por ele antes disso (tokens forjados/antigos).
+UNKNOWN_KID_TTL = 300
+# Intervalo mínimo entre downloads forçados por kid novo (rotação legítima é rara).
+MIN_REFRESH_INTERVAL = 30
+_MAX_UNKNOWN_KIDS = 1024
+
+
+class JWKSUnavailableError(Exception):
+    """Não há chaves carregadas e o download do JWKS falhou."""
+
+
+class JWKSKeyStore:
+    """Chaves de verificação por `kid`, prontas para `jwt.decode` (sem to_pem por request).
+
+    - O download roda em thread (`requests` é bloqueante) e é single-flight: requests
+      concorrentes esperam o mesmo refresh em vez de baixar o JWKS N vezes.
+    - kids desconhecidos ficam em cache negativo por UNKNOWN_KID_TTL segundos.
+    - `load_file` pré-carrega um JWKS local (testes, startup offline).
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = JWKS_CACHE_TTL,
+        unknown_kid_ttl: float = UNKNOWN_KID_TTL,
+        min_refresh_interval: float = MIN_REFRESH_INTERVAL,
+    ):
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.unknown_kid_ttl = unknown_kid_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.fetch_count = 0
+        self.fetch_errors = 0
+        self._keys: dict[str, Key] = {}
+        self._loaded_at = 0.0
+        self._unknown_kids: dict[str, float] = {}
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def load_jwks(self, jwks: dict[str, Any]) -> None:
+        keys: dict[str, Key] = {}
+        for key_data in jwks.get("keys", []):
+            kid = key_data.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwk.construct(key_data, algorithm=key_data.get("alg") or "RS256")
+            except JWKError as e:
+                logger.warning("JWKS: ignoring key %s: %s", kid, e)
+        self._keys = keys
+        self._loaded_at = time.monotonic()
+        self._unknown_kids.clear()
+
+    def load_file(self, path: str | Path) -> None:
+        with open(path, encoding="utf-8") as fh:
+            self.load_jwks(json.load(fh))
+
+    def clear(self) -> None:
+        self._keys = {}
+        self._loaded_at = 0.0
+        self._unknown_kids.clear()
+
+    async def get_key(self, kid: str) -> Key | None:
+        now = time.monotonic()
+        key = self._keys.get(kid)
+        age = now - self._loaded_at
+        if key is not None and age < self.ttl:
+            return key
+        if key is None and self._keys:
+            if self._unknown_kids.get(kid, 0.0) > now:
+                return None
+            if age < self.min_refresh_interval:
+                self._remember_unknown(kid, now)
+                return None
+
+        await self.refresh(seen_loaded_at=self._loaded_at)
+
+        key = self._keys.get(kid)
+        if key is None:
+            self._remember_unknown(kid, time.monotonic())
+        return key
+
+    async def refresh(self, seen_loaded_at: float | None = None) -> None:
+        """Baixa o JWKS. Com `seen_loaded_at`, não baixa de novo se outro refresh já terminou
+        enquanto esta coroutine esperava o lock."""
+        async with self._get_lock():
+            if seen_loaded_at is not None and self._loaded_at != seen_loaded_at:
+                return
+            if not self.jwks_url:
+                if not self._keys:
+                    raise JWKSUnavailableError("COGNITO_JWKS_URL não configurado")
+                return
+            self.fetch_count += 1
+            try:
+                jwks = await asyncio.to_thread(self._download)
+            except (http_requests.RequestException, ValueError) as e:
+                self.fetch_errors += 1
+                logger.error("JWKS fetch failed: %s", e)
+                if not self._keys:
+                    raise JWKSUnavailableError(str(e)) from e
+                # Mantém as chaves atuais; tenta de novo só depois do intervalo mínimo.
+                self._loaded_at = time.monotonic() - self.ttl + self.min_refresh_interval
+                return
+            self.load_jwks(jwks)
+
+    def _download(self) -> dict[str, Any]:
+        response = http_requests.get(self.jwks_url, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def _remember_unknown(self, kid: str, now: float) -> None:
+        if len(self._unknown_kids) >= _MAX_UNKNOWN_KIDS:
+            self._unknown_kids.clear()
+        self._unknown_kids[kid] = now + self.unknown_kid_ttl
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Lambda/Mangum e testes podem trocar de event loop; o Lock pertence a um só loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "keys": len(self._keys),
+            "fetches": self.fetch_count,
+            "fetch_errors": self.fetch_errors,
+            "unknown_kids": len(self._unknown_kids),
+        }
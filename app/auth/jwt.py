@@ -1,25 +1,31 @@
 """AWS Cognito JWT validation (JWKS) and optional local dev bypass."""
 
+import hashlib
 import logging
 import os
 import re
 import time
 from typing import Any
 
-import requests as http_requests
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwk, jwt
+from jose import JWTError, jwt
 
+from app.auth.jwks import JWKSKeyStore, JWKSUnavailableError
+from app.cache import TTLCache
 from app.config import (
+    AUTH_TOKEN_CACHE_MAX_TTL,
+    AUTH_TOKEN_CACHE_SIZE,
     COGNITO_APP_CLIENT_ID,
     COGNITO_ISSUER,
+    COGNITO_JWKS_FILE,
     COGNITO_JWKS_URL,
     COGNITO_USER_POOL_ID,
     DEV_AUTH_BYPASS,
     DEV_AUTH_BYPASS_SECRET,
     IS_DEVELOPMENT,
 )
+from app.metrics import counter_value, gauge_value, registry
 
 logger = logging.getLogger(__name__)
 
@@ -38,33 +44,39 @@ def normalize_cognito_sub(sub: str) -> str:
         return s.lower()
     return s
 
-_jwks_cache: dict[str, Any] | None = None
-_jwks_cache_time: float = 0
-JWKS_CACHE_TTL = 3600
 
+jwks_store = JWKSKeyStore(COGNITO_JWKS_URL)
+if COGNITO_JWKS_FILE:
+    jwks_store.load_file(COGNITO_JWKS_FILE)
 
-def _fetch_jwks() -> dict[str, Any]:
-    global _jwks_cache, _jwks_cache_time
+# Tokens já verificados: o SPA reenvia o mesmo access/ID token em toda request.
+token_cache = TTLCache(maxsize=AUTH_TOKEN_CACHE_SIZE, ttl=AUTH_TOKEN_CACHE_MAX_TTL)
 
-    now = time.time()
-    if _jwks_cache and (now - _jwks_cache_time) < JWKS_CACHE_TTL:
-        return _jwks_cache
 
-    response = http_requests.get(COGNITO_JWKS_URL, timeout=10)
-    response.raise_for_status()
-    _jwks_cache = response.json()
-    _jwks_cache_time = now
-    return _jwks_cache
+@registry.register_collector
+def _auth_metrics():
+    jwks = jwks_store.stats()
+    cache = token_cache.stats()
+    return [
+        counter_value("ginga_jwks_fetches", "Downloads do JWKS do Cognito.", jwks["fetches"]),
+        counter_value(
+            "ginga_jwks_fetch_errors", "Downloads do JWKS que falharam.", jwks["fetch_errors"]
+        ),
+        gauge_value("ginga_jwks_keys", "Chaves de assinatura carregadas.", jwks["keys"]),
+        counter_value("ginga_token_cache_hits", "Tokens servidos do cache.", cache["hits"]),
+        counter_value(
+            "ginga_token_cache_misses", "Tokens verificados (RS256).", cache["misses"]
+        ),
+        gauge_value("ginga_token_cache_size", "Tokens no cache.", cache["size"]),
+        gauge_value("ginga_token_cache_hit_ratio", "hits / (hits + misses).", cache["hit_rate"]),
+    ]
 
 
-def _get_signing_key(jwks: dict[str, Any], kid: str) -> Any | None:
-    for key_data in jwks.get("keys", []):
-        if key_data["kid"] == kid:
-            return jwk.construct(key_data)
-    return None
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
-def decode_cognito_jwt(token: str) -> dict[str, Any]:
+async def decode_cognito_jwt(token: str) -> dict[str, Any]:
     try:
         headers = jwt.get_unverified_headers(token)
     except JWTError:
@@ -80,14 +92,13 @@ def decode_cognito_jwt(token: str) -> dict[str, Any]:
             detail="Token sem kid.",
         )
 
-    jwks = _fetch_jwks()
-    signing_key = _get_signing_key(jwks, kid)
-
-    if not signing_key:
-        global _jwks_cache_time
-        _jwks_cache_time = 0
-        jwks = _fetch_jwks()
-        signing_key = _get_signing_key(jwks, kid)
+    try:
+        signing_key = await jwks_store.get_key(kid)
+    except JWKSUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chaves de assinatura indisponíveis.",
+        )
 
     if not signing_key:
         raise HTTPException(
@@ -98,7 +109,7 @@ def decode_cognito_jwt(token: str) -> dict[str, Any]:
     try:
         return jwt.decode(
             token,
-            signing_key.to_pem().decode("utf-8"),
+            signing_key,
             algorithms=["RS256"],
             audience=COGNITO_APP_CLIENT_ID,
             issuer=COGNITO_ISSUER,
@@ -126,7 +137,7 @@ def _dev_bypass_user(token: str) -> dict[str, str] | None:
     return {"id": sub, "email": email}
 
 
-def resolve_user_from_token(token: str) -> dict[str, str]:
+async def resolve_user_from_token(token: str) -> dict[str, str]:
     dev = _dev_bypass_user(token)
     if dev:
         return dev
@@ -137,20 +148,30 @@ def resolve_user_from_token(token: str) -> dict[str, str]:
             detail="Autenticação Cognito não configurada.",
         )
 
-    payload = decode_cognito_jwt(token)
+    cache_key = _token_cache_key(token)
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    payload = await decode_cognito_jwt(token)
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token sem identificação do usuário.",
         )
-    return {
+    user = {
         "id": normalize_cognito_sub(str(user_id)),
         "email": payload.get("email", ""),
         "given_name": payload.get("given_name", ""),
         "family_name": payload.get("family_name", ""),
         "username": payload.get("cognito:username", ""),
     }
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        # Só até o exp do token: depois disso a verificação completa volta a rodar (e falha).
+        token_cache.set(cache_key, user, ttl=min(exp - time.time(), AUTH_TOKEN_CACHE_MAX_TTL))
+    return dict(user)
 
 
 async def get_current_user(
@@ -161,7 +182,7 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Não autenticado.",
         )
-    return resolve_user_from_token(credentials.credentials)
+    return await resolve_user_from_token(credentials.credentials)
 
 
 async def get_current_user_optional(
@@ -170,6 +191,6 @@ async def get_current_user_optional(
     if credentials is None or not credentials.credentials:
         return None
     try:
-        return resolve_user_from_token(credentials.credentials)
+        return await resolve_user_from_token(credentials.credentials)
     except HTTPException:
         return None
@@ -0,0 +1,151 @@
+"""In-process LRU cache with per-entry TTL (one instance per worker/Lambda container), plus
+async backends (memory or Redis) for caches that may be shared between instances."""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU limitado a `maxsize` entradas; cada entrada expira após `ttl` segundos.
+
+    Thread-safe (rotas síncronas rodam no threadpool do Starlette). Mantém contadores de
+    hit/miss para métricas.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] <= now:
+                if item is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+class MemoryCacheBackend:
+    """Backend assíncrono sobre TTLCache (padrão): vale só para este processo."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._values = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        return [
+            self._counters[k] if k in self._counters else self._values.get(k) for k in keys
+        ]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._values.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._values.pop(key)
+
+    async def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """Mesma interface sobre Redis (ou compatível: Valkey, ElastiCache), compartilhado entre
+    instâncias. Valores em JSON; falhas do Redis viram miss e são apenas logadas."""
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:  # pragma: no cover - depende do extra instalado
+            raise RuntimeError("REDIS_URL definido, mas o pacote `redis` não está instalado") from e
+        self._client = redis_asyncio.from_url(url)
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        try:
+            raw = await self._client.mget(keys)
+        except Exception as e:  # cache nunca derruba a request
+            logger.warning("redis get failed: %s", e)
+            return [None] * len(keys)
+        return [None if v is None else json.loads(v) for v in raw]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            await self._client.set(key, json.dumps(value, default=_json_default), ex=int(ttl))
+        except Exception as e:
+            logger.warning("redis set failed: %s", e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(key)
+        except Exception as e:
+            logger.warning("redis delete failed: %s", e)
+
+    async def incr(self, key: str) -> int:
+        try:
+            return int(await self._client.incr(key))
+        except Exception as e:
+            logger.warning("redis incr failed: %s", e)
+            return 0
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} não é serializável em JSON")
+
+
+def make_cache_backend(redis_url: str, maxsize: int, ttl: float):
+    """RedisCacheBackend quando `redis_url` está definido; senão MemoryCacheBackend."""
+    if redis_url:
+        return RedisCacheBackend(redis_url)
+    return MemoryCacheBackend(maxsize=maxsize, ttl=ttl)
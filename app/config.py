@@ -32,6 +32,19 @@ COGNITO_ISSUER = (
     else ""
 )
 COGNITO_JWKS_URL = f"{COGNITO_ISSUER}/.well-known/jwks.json" if COGNITO_ISSUER else ""
+# Optional local JWKS (same JSON as the Cognito endpoint) preloaded at startup: tests/offline.
+COGNITO_JWKS_FILE = os.environ.get("COGNITO_JWKS_FILE", "")
+
+# Verified-token cache (sha256(token) -> resolved user until the token's exp). 0 disables.
+AUTH_TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "4096"))
+AUTH_TOKEN_CACHE_MAX_TTL = int(os.environ.get("AUTH_TOKEN_CACHE_MAX_TTL", "3600"))
+
+# Optional Redis (or compatible) shared by all instances; empty = in-process caches only.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+# Per-user /dashboard/recommended-jobs cache (seconds; 0 disables).
+RECOMMENDATION_CACHE_TTL = int(os.environ.get("RECOMMENDATION_CACHE_TTL", "300"))
+RECOMMENDATION_CACHE_SIZE = int(os.environ.get("RECOMMENDATION_CACHE_SIZE", "10000"))
 
 # When true and ENVIRONMENT=development, accept Bearer tokens without Cognito verification
 # (value must equal DEV_AUTH_BYPASS_SECRET). Never enable in production.
@@ -66,10 +79,30 @@ DB_POOL_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
 DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
 DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "3600"))
 
+# Routes over their declared SQL budget (declare_query_budget) raise instead of just logging.
+QUERY_BUDGET_STRICT = (
+    os.environ.get("QUERY_BUDGET_STRICT", "true" if IS_TESTING else "false").lower() == "true"
+)
+
+# GET /metrics (Prometheus text format) and/or one CloudWatch EMF line per request on stdout.
+# Off by default: the endpoint exposes routes, traffic and pool/cache internals. With
+# METRICS_TOKEN set, scrapes must send "Authorization: Bearer <token>".
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() == "true"
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_EMF = os.environ.get("METRICS_EMF", "false").lower() == "true"
+
 AUTO_RUN_MIGRATIONS = os.environ.get("AUTO_RUN_MIGRATIONS", "false").lower() == "true"
 
 # S3
 S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME", "")
 S3_REGION = os.environ.get("S3_REGION", COGNITO_REGION or "us-east-1")
+# S3 compatível local (MinIO, moto server): ex. http://localhost:9000
+S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL", "")
+# Base pública dos logos (GET /api/v1/uploads/public/... da API ou uma CDN na frente dela).
+# Definida: logo_url nas listagens é estável (cacheável pelo navegador) em vez de pré-assinada.
+PUBLIC_ASSET_BASE_URL = os.environ.get("PUBLIC_ASSET_BASE_URL", "").rstrip("/")
 
 MAX_FILE_SIZE = int(os.environ.get("MAX_FILE_SIZE", str(10 * 1024 * 1024)))
+# Processos para gerar variantes de imagem (Pillow); 0 = threads do próprio processo (Lambda
+# não tem /dev/shm, então ProcessPoolExecutor não funciona lá).
+IMAGE_VARIANT_WORKERS = int(os.environ.get("IMAGE_VARIANT_WORKERS", "2"))
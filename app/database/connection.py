@@ -1,14 +1,22 @@
 """Async PostgreSQL engine and session (Lambda-friendly NullPool)."""
 
+import inspect
+import logging
 import os
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
 
+import orjson
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as SATimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config import (
     DATABASE_URL,
@@ -17,6 +25,10 @@ from app.config import (
     DB_POOL_SIZE,
     DB_POOL_TIMEOUT,
 )
+from app.logging_config import QueryStats, query_stats_var
+from app.metrics import counter_value, db_connection_wait, gauge_value, registry
+
+logger = logging.getLogger(__name__)
 
 IS_TESTING = os.getenv("ENVIRONMENT", "development").lower() == "testing"
 IS_SQLITE = DATABASE_URL.startswith("sqlite")
@@ -24,20 +36,46 @@ IS_LAMBDA = os.getenv("AWS_LAMBDA_FUNCTION_NAME") is not None
 
 USE_NULL_POOL = IS_SQLITE or IS_TESTING or IS_LAMBDA
 
+# Esperas por conexão que estouraram DB_POOL_TIMEOUT.
+_pool_timeouts = 0
+
+
+class _TimedQueuePool(AsyncAdaptedQueuePool):
+    """Mede a espera por conexão (dimensionamento de DB_POOL_SIZE/DB_MAX_OVERFLOW).
+
+    Medido no checkout, que só acontece no primeiro SQL da sessão: requests que não
+    consultam o banco não pegam conexão nem entram no histograma.
+    """
+
+    def connect(self):
+        global _pool_timeouts
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except SATimeoutError:
+            _pool_timeouts += 1
+            raise
+        finally:
+            db_connection_wait.observe(time.perf_counter() - started)
+
+
 if IS_SQLITE:
     engine = create_async_engine(
         DATABASE_URL,
         echo=False,
         future=True,
         poolclass=NullPool,
+        json_deserializer=orjson.loads,
     )
 else:
-    engine_kwargs: dict = {"echo": False, "future": True}
+    # Colunas/expressões JSON (ex.: perfil montado no Postgres em GET /me) via orjson.
+    engine_kwargs: dict = {"echo": False, "future": True, "json_deserializer": orjson.loads}
     if USE_NULL_POOL:
         engine_kwargs["poolclass"] = NullPool
     else:
         engine_kwargs.update(
             {
+                "poolclass": _TimedQueuePool,
                 "pool_size": DB_POOL_SIZE,
                 "max_overflow": DB_POOL_MAX_OVERFLOW,
                 "pool_timeout": DB_POOL_TIMEOUT,
@@ -46,6 +84,73 @@ else:
         )
     engine = create_async_engine(DATABASE_URL, **engine_kwargs)
 
+
+class QueryBudgetExceeded(AssertionError):
+    """Mais statements SQL do que o orçamento declarado (query_budget / declare_query_budget)."""
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info["query_started_at"].pop()
+    stats = query_stats_var.get()
+    if stats is not None:
+        stats.record((time.perf_counter() - started) * 1000)
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    # after_cursor_execute não roda quando o statement falha: descarta o início pendente.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        started = conn.info["query_started_at"].pop()
+        stats = query_stats_var.get()
+        if stats is not None:
+            stats.record((time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Conta o SQL emitido no bloco (inclusive por requests ASGI feitas dentro dele) e
+    levanta QueryBudgetExceeded se passar de `max_queries`. Para testes e scripts."""
+    stats = QueryStats(parent=query_stats_var.get())
+    token = query_stats_var.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats_var.reset(token)
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{stats.count} queries SQL (orçamento: {max_queries}, {stats.duration_ms:.1f}ms)"
+        )
+
+
+@registry.register_collector
+def _pool_metrics():
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):  # NullPool (Lambda/testes): nada a reportar
+        return []
+    return [
+        gauge_value("ginga_db_pool_size", "Conexões permanentes (DB_POOL_SIZE).", pool.size()),
+        gauge_value("ginga_db_pool_checked_out", "Conexões em uso.", pool.checkedout()),
+        gauge_value("ginga_db_pool_idle", "Conexões ociosas no pool.", pool.checkedin()),
+        gauge_value(
+            "ginga_db_pool_overflow",
+            "Conexões além de pool_size (limite DB_MAX_OVERFLOW).",
+            max(pool.overflow(), 0),
+        ),
+        counter_value(
+            "ginga_db_pool_timeouts",
+            "Esperas por conexão além de DB_POOL_TIMEOUT.",
+            _pool_timeouts,
+        ),
+    ]
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -55,16 +160,47 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+_AFTER_COMMIT = "after_commit"
+
+AfterCommitHook = Callable[[], Awaitable[None] | None]
+
+
+def after_commit(session: AsyncSession, hook: AfterCommitHook) -> None:
+    """Agenda `hook` para depois do commit da request (get_db); descartado em rollback.
+
+    Para caches (processo ou Redis) que não podem refletir escritas ainda não commitadas
+    (invalidar antes do commit deixa outra request recalcular a partir do estado antigo).
+    Roda no teardown de get_db, depois de a resposta ser enviada: só para o que pode se
+    perder (na Lambda, sem garantia de execução); trabalho que precisa acontecer fica na
+    request.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(hook)
+
+
+async def _run_after_commit(hooks: list[AfterCommitHook]) -> None:
+    for hook in hooks:
+        try:
+            result = hook()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            # O commit já aconteceu: falha do hook não vira erro da request.
+            logger.exception("after_commit hook failed")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
+            hooks = session.info.pop(_AFTER_COMMIT, [])
         except Exception:
+            session.info.pop(_AFTER_COMMIT, None)
             await session.rollback()
             raise
         finally:
             await session.close()
+    await _run_after_commit(hooks)
 
 
 async def init_db() -> None:
@@ -0,0 +1,69 @@
+"""job full-text search (tsvector + GIN, portuguese/unaccent)
+
+Revision ID: 000002
+Revises: 000001
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "000002"
+down_revision: str | None = "000001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # Igual a `portuguese`, mas sem acentos: "programação" casa com "programacao".
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'ginga_pt') THEN
+                CREATE TEXT SEARCH CONFIGURATION ginga_pt (COPY = portuguese);
+                ALTER TEXT SEARCH CONFIGURATION ginga_pt
+                    ALTER MAPPING FOR hword, hword_part, word
+                    WITH unaccent, portuguese_stem;
+            END IF;
+        END
+        $$
+        """
+    )
+
+    op.add_column("api_jobs", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+
+    # Mesma ponderação de app.services.job_service.job_search_document().
+    op.execute(
+        """
+        UPDATE api_jobs AS j SET search_vector =
+            setweight(to_tsvector('ginga_pt'::regconfig, coalesce(j.title, '')), 'A')
+            || setweight(to_tsvector('ginga_pt'::regconfig, coalesce((
+                SELECT string_agg(t.name, ' ')
+                FROM api_job_tags jt JOIN api_tags t ON t.id = jt.tag_id
+                WHERE jt.job_id = j.id
+            ), '')), 'B')
+            || setweight(to_tsvector('ginga_pt'::regconfig, coalesce((
+                SELECT c.name FROM api_companies c WHERE c.id = j.company_id
+            ), '')), 'C')
+            || setweight(to_tsvector('ginga_pt'::regconfig, coalesce(j.description, '')), 'D')
+        """
+    )
+
+    op.create_index(
+        "ix_api_jobs_search_vector",
+        "api_jobs",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_jobs_search_vector", table_name="api_jobs")
+    op.drop_column("api_jobs", "search_vector")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS ginga_pt")
@@ -0,0 +1,38 @@
+"""composite indexes for keyset (cursor) pagination
+
+Revision ID: 000003
+Revises: 000002
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "000003"
+down_revision: str | None = "000002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_api_jobs_created_at_id", "api_jobs", ["created_at", "id"])
+    op.create_index(
+        "ix_api_applications_user_id_created_at_id",
+        "api_applications",
+        ["user_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_api_applications_job_id_created_at_id",
+        "api_applications",
+        ["job_id", "created_at", "id"],
+    )
+    op.create_index("ix_api_companies_name_id", "api_companies", ["name", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_companies_name_id", table_name="api_companies")
+    op.drop_index("ix_api_applications_job_id_created_at_id", table_name="api_applications")
+    op.drop_index("ix_api_applications_user_id_created_at_id", table_name="api_applications")
+    op.drop_index("ix_api_jobs_created_at_id", table_name="api_jobs")
@@ -0,0 +1,41 @@
+"""denormalized api_companies.active_jobs_count
+
+Revision ID: 000004
+Revises: 000003
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "000004"
+down_revision: str | None = "000003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "api_companies",
+        sa.Column("active_jobs_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE api_companies AS c SET active_jobs_count = (
+            SELECT count(*) FROM api_jobs j WHERE j.company_id = c.id AND j.is_active
+        )
+        """
+    )
+    op.create_index(
+        "ix_api_companies_active_jobs_count_id",
+        "api_companies",
+        ["active_jobs_count", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_companies_active_jobs_count_id", table_name="api_companies")
+    op.drop_column("api_companies", "active_jobs_count")
@@ -0,0 +1,62 @@
+"""job skill index (api_job_skills) for recommendations
+
+Revision ID: 000005
+Revises: 000004
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from app.skills import job_skills
+
+revision: str = "000005"
+down_revision: str | None = "000004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "api_job_skills",
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("skill", sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["api_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "skill"),
+    )
+    op.create_index("ix_api_job_skills_skill_job_id", "api_job_skills", ["skill", "job_id"])
+
+    # Backfill com a mesma extração usada pela API (termos TECH_LIST + tags).
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT j.id, j.requirements,
+                   coalesce(array_agg(t.name) FILTER (WHERE t.name IS NOT NULL), '{}')
+            FROM api_jobs j
+            LEFT JOIN api_job_tags jt ON jt.job_id = j.id
+            LEFT JOIN api_tags t ON t.id = jt.tag_id
+            GROUP BY j.id, j.requirements
+            """
+        )
+    ).all()
+    values = [
+        {"job_id": job_id, "skill": skill[:100]}
+        for job_id, requirements, tag_names in rows
+        for skill in job_skills(requirements, list(tag_names))
+    ]
+    if values:
+        bind.execute(
+            sa.text(
+                "INSERT INTO api_job_skills (job_id, skill) VALUES (:job_id, :skill) "
+                "ON CONFLICT DO NOTHING"
+            ),
+            values,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_job_skills_skill_job_id", table_name="api_job_skills")
+    op.drop_table("api_job_skills")
@@ -0,0 +1,61 @@
+"""normalized api_profiles.skill_list (text[] + GIN)
+
+Revision ID: 000006
+Revises: 000005
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "000006"
+down_revision: str | None = "000005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "api_profiles",
+        sa.Column(
+            "skill_list",
+            postgresql.ARRAY(sa.String(length=100)),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+    # Mesma normalização de app.skills.parse_skills: minúsculas, espaços colapsados,
+    # vazios descartados, sem repetição (mantém a ordem da primeira ocorrência).
+    op.execute(
+        r"""
+        UPDATE api_profiles AS p SET skill_list = coalesce((
+            SELECT array_agg(left(d.skill, 100) ORDER BY d.pos)
+            FROM (
+                SELECT t.skill, min(t.pos) AS pos
+                FROM (
+                    SELECT lower(btrim(regexp_replace(u.part, '\s+', ' ', 'g'))) AS skill,
+                           u.pos
+                    FROM unnest(string_to_array(p.skills, ',')) WITH ORDINALITY AS u(part, pos)
+                ) AS t
+                WHERE t.skill <> ''
+                GROUP BY t.skill
+            ) AS d
+        ), '{}')
+        WHERE coalesce(p.skills, '') <> ''
+        """
+    )
+    op.create_index(
+        "ix_api_profiles_skill_list",
+        "api_profiles",
+        ["skill_list"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_profiles_skill_list", table_name="api_profiles")
+    op.drop_column("api_profiles", "skill_list")
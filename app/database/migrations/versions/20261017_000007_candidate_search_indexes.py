@@ -0,0 +1,31 @@
+"""indexes for recruiter candidate search (city, education status)
+
+Revision ID: 000007
+Revises: 000006
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "000007"
+down_revision: str | None = "000006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_api_profiles_city_lower", "api_profiles", [sa.text("lower(city)")])
+    op.create_index(
+        "ix_api_education_profile_user_id_status",
+        "api_education",
+        ["profile_user_id", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_education_profile_user_id_status", table_name="api_education")
+    op.drop_index("ix_api_profiles_city_lower", table_name="api_profiles")
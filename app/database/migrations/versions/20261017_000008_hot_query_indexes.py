@@ -0,0 +1,68 @@
+"""composite/partial indexes for hot queries (active jobs, inbox by status, tags, trgm)
+
+Revision ID: 000008
+Revises: 000007
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "000008"
+down_revision: str | None = "000007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Predicado igual ao gerado por Job.is_active.is_(True), para o planner casar o índice.
+    op.create_index(
+        "ix_api_jobs_active_created_at_id",
+        "api_jobs",
+        ["created_at", "id"],
+        postgresql_where=sa.text("is_active IS true"),
+    )
+    op.create_index(
+        "ix_api_jobs_active_company_id_created_at_id",
+        "api_jobs",
+        ["company_id", "created_at", "id"],
+        postgresql_where=sa.text("is_active IS true"),
+    )
+    op.create_index(
+        "ix_api_applications_job_id_status_created_at_id",
+        "api_applications",
+        ["job_id", "status", "created_at", "id"],
+    )
+    op.create_index("ix_api_tags_name_lower", "api_tags", [sa.text("lower(name)")])
+    op.create_index("ix_api_job_tags_tag_id_job_id", "api_job_tags", ["tag_id", "job_id"])
+    op.create_index(
+        "ix_api_tags_name_trgm",
+        "api_tags",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_api_companies_name_trgm",
+        "api_companies",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_companies_name_trgm", table_name="api_companies")
+    op.drop_index("ix_api_tags_name_trgm", table_name="api_tags")
+    op.drop_index("ix_api_job_tags_tag_id_job_id", table_name="api_job_tags")
+    op.drop_index("ix_api_tags_name_lower", table_name="api_tags")
+    op.drop_index(
+        "ix_api_applications_job_id_status_created_at_id", table_name="api_applications"
+    )
+    op.drop_index("ix_api_jobs_active_company_id_created_at_id", table_name="api_jobs")
+    op.drop_index("ix_api_jobs_active_created_at_id", table_name="api_jobs")
@@ -5,6 +5,7 @@ from app.database.models.company import Company
 from app.database.models.job import Job
 from app.database.models.portfolio import Education, ProfessionalExperience, TechProject
 from app.database.models.profile import Profile
+from app.database.models.skill import JobSkill
 from app.database.models.tag import JobTag, Tag
 from app.database.models.user import User
 
@@ -13,6 +14,7 @@ __all__ = [
     "Company",
     "Education",
     "Job",
+    "JobSkill",
     "JobTag",
     "ProfessionalExperience",
     "Profile",
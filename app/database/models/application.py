@@ -1,6 +1,6 @@
 """Job application."""
 
-from sqlalchemy import ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -8,7 +8,20 @@ from app.database.base import Base, TimestampMixin
 
 class Application(Base, TimestampMixin):
     __tablename__ = "api_applications"
-    __table_args__ = (UniqueConstraint("user_id", "job_id", name="uq_api_applications_user_job"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id", name="uq_api_applications_user_job"),
+        # Keyset pagination: (created_at, id) por candidato e por vaga.
+        Index("ix_api_applications_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_api_applications_job_id_created_at_id", "job_id", "created_at", "id"),
+        # Inbox do recrutador filtrada por status.
+        Index(
+            "ix_api_applications_job_id_status_created_at_id",
+            "job_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
@@ -1,6 +1,6 @@
 """Company owned by a user."""
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -8,6 +8,17 @@ from app.database.base import Base, TimestampMixin
 
 class Company(Base, TimestampMixin):
     __tablename__ = "api_companies"
+    __table_args__ = (
+        Index("ix_api_companies_name_id", "name", "id"),
+        Index("ix_api_companies_active_jobs_count_id", "active_jobs_count", "id"),
+        # Busca do catálogo (ILIKE '%q%'); requer pg_trgm.
+        Index(
+            "ix_api_companies_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -21,6 +32,11 @@ class Company(Base, TimestampMixin):
         nullable=False,
         index=True,
     )
+    # Desnormalizado: mantido por JobService (create/update de is_active); corrigir drift com
+    # scripts/reconcile_company_counts.py.
+    active_jobs_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     owner = relationship("User", back_populates="companies")
     jobs = relationship("Job", back_populates="company", cascade="all, delete-orphan")
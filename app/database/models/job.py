@@ -1,6 +1,9 @@
 """Job posting."""
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from typing import Any
+
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -8,6 +11,24 @@ from app.database.base import Base, TimestampMixin
 
 class Job(Base, TimestampMixin):
     __tablename__ = "api_jobs"
+    __table_args__ = (
+        Index("ix_api_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_api_jobs_created_at_id", "created_at", "id"),
+        # Listagens públicas só enxergam vagas ativas (predicado igual ao de list_public).
+        Index(
+            "ix_api_jobs_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active IS true"),
+        ),
+        Index(
+            "ix_api_jobs_active_company_id_created_at_id",
+            "company_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active IS true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     company_id: Mapped[int] = mapped_column(
@@ -20,6 +41,8 @@ class Job(Base, TimestampMixin):
     requirements: Mapped[str] = mapped_column(Text, default="", nullable=False)
     salary_range: Mapped[str] = mapped_column(String(100), default="", nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # Mantido por JobService (título > tags > empresa > descrição); ver job_search_document().
+    search_vector: Mapped[Any | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
 
     company = relationship("Company", back_populates="jobs")
     tags = relationship("Tag", secondary="api_job_tags", back_populates="jobs")
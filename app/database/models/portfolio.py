@@ -2,7 +2,7 @@
 
 from datetime import date
 
-from sqlalchemy import Date, ForeignKey, String, Text
+from sqlalchemy import Date, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -29,6 +29,10 @@ class ProfessionalExperience(Base, TimestampMixin):
 
 class Education(Base, TimestampMixin):
     __tablename__ = "api_education"
+    __table_args__ = (
+        # Filtro `education_status` da busca de candidatos.
+        Index("ix_api_education_profile_user_id_status", "profile_user_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     profile_user_id: Mapped[str] = mapped_column(
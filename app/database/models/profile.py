@@ -1,6 +1,7 @@
 """Portfolio profile (1:1 with User)."""
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -8,6 +9,11 @@ from app.database.base import Base, TimestampMixin
 
 class Profile(Base, TimestampMixin):
     __tablename__ = "api_profiles"
+    __table_args__ = (
+        Index("ix_api_profiles_skill_list", "skill_list", postgresql_using="gin"),
+        # Filtro `city` da busca de candidatos (comparação sem maiúsculas).
+        Index("ix_api_profiles_city_lower", text("lower(city)")),
+    )
 
     user_id: Mapped[str] = mapped_column(
         String(255),
@@ -24,6 +30,13 @@ class Profile(Base, TimestampMixin):
         nullable=False,
         comment="Comma-separated skills",
     )
+    # Forma normalizada de `skills` (app.skills.parse_skills), mantida por UserService.
+    skill_list: Mapped[list[str]] = mapped_column(
+        ARRAY(String(100)),
+        default=list,
+        server_default="{}",
+        nullable=False,
+    )
     github_url: Mapped[str] = mapped_column(String(500), default="", nullable=False)
     linkedin_url: Mapped[str] = mapped_column(String(500), default="", nullable=False)
     is_portfolio_public: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -0,0 +1,19 @@
+"""Skill index of job postings (normalized TECH_LIST terms + tags)."""
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+
+
+class JobSkill(Base):
+    """Preenchido por JobService ao salvar a vaga (ver app.skills.job_skills)."""
+
+    __tablename__ = "api_job_skills"
+    __table_args__ = (Index("ix_api_job_skills_skill_job_id", "skill", "job_id"),)
+
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("api_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    skill: Mapped[str] = mapped_column(String(100), primary_key=True)
@@ -1,6 +1,6 @@
 """Technology tags and job association."""
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base
@@ -8,7 +8,18 @@ from app.database.base import Base
 
 class Tag(Base):
     __tablename__ = "api_tags"
-    __table_args__ = (UniqueConstraint("name", name="uq_api_tags_name"),)
+    __table_args__ = (
+        UniqueConstraint("name", name="uq_api_tags_name"),
+        # Filtro `tag` de /jobs e resolução de nomes em JobService._set_tags.
+        Index("ix_api_tags_name_lower", text("lower(name)")),
+        # Autocomplete (ILIKE '%q%'); requer pg_trgm.
+        Index(
+            "ix_api_tags_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
@@ -18,7 +29,10 @@ class Tag(Base):
 
 class JobTag(Base):
     __tablename__ = "api_job_tags"
-    __table_args__ = (UniqueConstraint("job_id", "tag_id", name="uq_api_job_tags"),)
+    __table_args__ = (
+        UniqueConstraint("job_id", "tag_id", name="uq_api_job_tags"),
+        Index("ix_api_job_tags_tag_id_job_id", "tag_id", "job_id"),
+    )
 
     job_id: Mapped[int] = mapped_column(
         ForeignKey("api_jobs.id", ondelete="CASCADE"),
@@ -1,14 +1,31 @@
 """FastAPI dependencies."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.connection import get_db
+from app.logging_config import query_stats_var
 
-__all__ = ["get_db"]
+__all__ = ["declare_query_budget", "get_db"]
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_db():
         yield session
+
+
+def declare_query_budget(max_queries: int) -> Callable[[], Awaitable[None]]:
+    """Orçamento de SQL da rota: `dependencies=[Depends(declare_query_budget(5))]`.
+
+    Verificado pelo RequestIdMiddleware ao fim da request: loga um aviso e, com
+    QUERY_BUDGET_STRICT (padrão em ENVIRONMENT=testing), levanta QueryBudgetExceeded.
+    """
+
+    # async: dependência sync iria para o threadpool só para gravar um atributo.
+    async def _declare() -> None:
+        stats = query_stats_var.get()
+        if stats is not None:
+            stats.budget = max_queries
+
+    return _declare
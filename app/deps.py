@@ -1,14 +1,20 @@
 """Service injection."""
 
-from fastapi import Depends
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.connection import get_db
 from app.services.application_service import ApplicationService
 from app.services.company_service import CompanyService
+from app.services.file_service import is_avatar_key, is_company_logo_key
 from app.services.job_service import JobService
 from app.services.user_service import UserService
 
+# Sessão sob demanda com o mesmo ciclo de get_db (espera no pool, commit/rollback).
+_db_session = asynccontextmanager(get_db)
+
 
 def get_user_service(session: AsyncSession = Depends(get_db)) -> UserService:
     return UserService(session)
@@ -24,3 +30,18 @@ def get_job_service(session: AsyncSession = Depends(get_db)) -> JobService:
 
 def get_application_service(session: AsyncSession = Depends(get_db)) -> ApplicationService:
     return ApplicationService(session)
+
+
+async def require_public_asset(s3_key: str) -> None:
+    """404 se `s3_key` não pode ser servida por GET /uploads/public.
+
+    Logo de empresa não consulta o banco; avatar (atual de perfil publicado) abre uma sessão
+    só para a checagem, fechada antes do streaming do arquivo.
+    """
+    if is_company_logo_key(s3_key):
+        return
+    if is_avatar_key(s3_key):
+        async with _db_session() as session:
+            if await UserService(session).is_public_avatar(s3_key):
+                return
+    raise HTTPException(status.HTTP_404_NOT_FOUND, "Arquivo não encontrado.")
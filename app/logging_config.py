@@ -9,6 +9,32 @@ from datetime import UTC, datetime
 request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
 
 
+class QueryStats:
+    """SQL emitido num escopo (request, teste): preenchido pelos hooks de
+    app.database.connection. `parent` recebe as mesmas contagens (escopos aninhados)."""
+
+    __slots__ = ("count", "duration_ms", "budget", "parent")
+
+    def __init__(self, parent: "QueryStats | None" = None):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.budget: int | None = None
+        self.parent = parent
+
+    def record(self, duration_ms: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration_ms += duration_ms
+            stats = stats.parent
+
+
+query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+# Campos passados via `extra=` que entram no JSON (linha de acesso do RequestIdMiddleware).
+_EXTRA_FIELDS = ("method", "path", "route", "status", "duration_ms")
+
+
 class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
@@ -20,6 +46,13 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
             "request_id": request_id_var.get("-"),
         }
+        for key in _EXTRA_FIELDS:
+            if key in record.__dict__:
+                log_entry[key] = record.__dict__[key]
+        stats = query_stats_var.get()
+        if stats is not None:
+            log_entry["db_queries"] = stats.count
+            log_entry["db_ms"] = round(stats.duration_ms, 2)
         if record.exc_info and record.exc_info[0]:
             log_entry["exception"] = self.formatException(record.exc_info)
         return json.dumps(log_entry, ensure_ascii=False)
@@ -1,16 +1,29 @@
 """Ginga FastAPI application entrypoint."""
 
 import logging
+import secrets
+import time
 import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
-from starlette.middleware.base import BaseHTTPMiddleware
-
-from app.config import FRONTEND_URL
-from app.logging_config import request_id_var
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import metrics
+from app.config import (
+    FRONTEND_URL,
+    METRICS_EMF,
+    METRICS_ENABLED,
+    METRICS_TOKEN,
+    QUERY_BUDGET_STRICT,
+)
+from app.database.connection import QueryBudgetExceeded
+from app.logging_config import QueryStats, query_stats_var, request_id_var
+from app.responses import ORJSONResponse
 from app.routes import api_router
 
 logger = logging.getLogger(__name__)
@@ -18,25 +31,124 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from app.auth.jwt import jwks_store
+    from app.config import COGNITO_JWKS_URL
     from app.database.connection import close_db
+    from app.services.image_variants import shutdown_executor
 
+    if COGNITO_JWKS_URL:
+        try:
+            # Primeira request autenticada não paga o download do JWKS.
+            await jwks_store.refresh()
+        except Exception as e:
+            logger.warning("JWKS warm-up failed: %s", e)
     yield
+    shutdown_executor()
     await close_db()
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+def server_timing(stats: QueryStats, total_ms: float) -> str:
+    return (
+        f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", '
+        f"total;dur={total_ms:.1f}"
+    )
+
+
+def record_request(scope: Scope, status: int, total_ms: float, stats: QueryStats) -> None:
+    """Métricas por rota, linha EMF opcional e log de acesso de uma request concluída."""
+    method = scope["method"]
+    path = scope["path"]
+    # Template da rota (sem ids) como label; 404 de path desconhecido vira um só valor.
+    route_label = getattr(scope.get("route"), "path", None) or "unmatched"
+    metrics.observe_request(method, route_label, status, total_ms / 1000, stats.count)
+    if METRICS_EMF:
+        metrics.emit_emf(method, route_label, status, total_ms, stats.count, stats.duration_ms)
+    logger.info(
+        "%s %s %s",
+        method,
+        path,
+        status,
+        extra={
+            "method": method,
+            "path": path,
+            "route": route_label,
+            "status": status,
+            "duration_ms": round(total_ms, 2),
+        },
+    )
+
+
+class RequestIdMiddleware:
+    """request_id nos logs, SQL por request (Server-Timing + linha de acesso), métricas
+    por rota e orçamento de queries declarado pelas rotas.
+
+    ASGI puro (sem BaseHTTPMiddleware): a app roda na mesma task da request, sem a fila
+    intermediária de mensagens, então contextvars e respostas em streaming passam intactos.
+    Server-Timing e X-Request-Id entram no `http.response.start`; métricas e log de acesso
+    saem no último pedaço do body.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
         req_id = (
-            request.headers.get("x-amzn-trace-id")
-            or request.headers.get("x-request-id")
-            or str(uuid.uuid4())[:8]
+            headers.get("x-amzn-trace-id") or headers.get("x-request-id") or str(uuid.uuid4())[:8]
         )
         token = request_id_var.set(req_id)
+        stats = QueryStats(parent=query_stats_var.get())
+        stats_token = query_stats_var.set(stats)
+        started = time.perf_counter()
+        status = 500
+        finished = False
+
+        def finish() -> None:
+            nonlocal finished
+            finished = True
+            total_ms = (time.perf_counter() - started) * 1000
+            record_request(scope, status, total_ms, stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                # Antes dos headers saírem: em modo estrito ainda dá para virar 500 (e `status`
+                # continua 500 para métricas/log de acesso).
+                self._check_budget(scope, stats)
+                status = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Request-Id"] = req_id
+                response_headers["Server-Timing"] = server_timing(
+                    stats, (time.perf_counter() - started) * 1000
+                )
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        metrics.http_in_flight.inc()
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         finally:
+            if not finished:
+                # Exceção antes/durante a resposta (o ServerErrorMiddleware responde 500).
+                finish()
+            metrics.http_in_flight.dec()
+            query_stats_var.reset(stats_token)
             request_id_var.reset(token)
 
+    def _check_budget(self, scope: Scope, stats: QueryStats) -> None:
+        if stats.budget is None or stats.count <= stats.budget:
+            return
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        msg = f"{scope['method']} {route}: {stats.count} queries SQL (orçamento: {stats.budget})"
+        if QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(msg)
+        logger.warning("query budget exceeded: %s", msg)
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -44,6 +156,7 @@ def create_app() -> FastAPI:
         description="API REST do Ginga (vagas, empresas, perfis). Autenticação via AWS Cognito.",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     app.add_middleware(RequestIdMiddleware)
     allowed_origins = ["*"] if FRONTEND_URL == "*" else [FRONTEND_URL]
@@ -85,6 +198,18 @@ def create_app() -> FastAPI:
                 },
             ) from e
 
+    if METRICS_ENABLED:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics_endpoint(request: Request):
+            if METRICS_TOKEN and not secrets.compare_digest(
+                request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"
+            ):
+                raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Não autorizado.")
+            return PlainTextResponse(
+                metrics.registry.render(), media_type="text/plain; version=0.0.4"
+            )
+
     app.include_router(api_router, prefix="/api/v1")
     return app
 
@@ -0,0 +1,240 @@
+"""In-process metrics (Prometheus text format at /metrics, optional CloudWatch EMF on stdout).
+
+Sem prometheus_client: contadores/histogramas simples por processo (cada worker uvicorn ou
+container Lambda expõe os seus). Valores de outros componentes (pool do engine, JWKS,
+caches) são lidos na hora do scrape por coletores registrados em `collectors`.
+"""
+
+import bisect
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Buckets (segundos) pensados para API + Postgres: 5ms .. 10s.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34)
+
+Labels = tuple[tuple[str, str], ...]
+Sample = tuple[str, Labels, float]
+
+
+def _labels(**labels: Any) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + inner + "}"
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+
+    def samples(self) -> list[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        # Família e amostra com o mesmo nome `_total` (no formato 0.0.4 o TYPE tem que casar
+        # com o nome da amostra, senão o Prometheus ingere como untyped).
+        super().__init__(f"{name}_total", help_text)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [(self.name, k, v) for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [(self.name, k, v) for k, v in self._values.items()]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> ([contagem por bucket], soma, contagem)
+        self._values: dict[Labels, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _labels(**labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, n = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            if idx < len(counts):
+                counts[idx] += 1
+            self._values[key] = (counts, total + value, n + 1)
+
+    def samples(self) -> list[Sample]:
+        out: list[Sample] = []
+        with self._lock:
+            items = [(k, list(c), s, n) for k, (c, s, n) in self._values.items()]
+        for key, counts, total, n in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                out.append((f"{self.name}_bucket", key + (("le", f"{bound:g}"),), cumulative))
+            out.append((f"{self.name}_bucket", key + (("le", "+Inf"),), n))
+            out.append((f"{self.name}_sum", key, total))
+            out.append((f"{self.name}_count", key, n))
+        return out
+
+
+class _CollectedMetric(_Metric):
+    """Métrica calculada no scrape por um coletor."""
+
+    def __init__(self, name: str, help_text: str, type_name: str, samples: list[Sample]):
+        super().__init__(name, help_text)
+        self.type_name = type_name
+        self._samples = samples
+
+    def samples(self) -> list[Sample]:
+        return self._samples
+
+
+Collector = Callable[[], Iterable[_Metric]]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: list[_Metric] = []
+        self.collectors: list[Collector] = []
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._add(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._add(Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Iterable[float]) -> Histogram:
+        return self._add(Histogram(name, help_text, buckets))
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Collector) -> Collector:
+        self.collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        """Formato texto do Prometheus (0.0.4)."""
+        metrics = list(self.metrics)
+        for collector in self.collectors:
+            metrics.extend(collector())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def gauge_value(name: str, help_text: str, value: float, **labels: Any) -> _Metric:
+    return _CollectedMetric(name, help_text, "gauge", [(name, _labels(**labels), value)])
+
+
+def counter_value(name: str, help_text: str, value: float, **labels: Any) -> _Metric:
+    total = f"{name}_total"
+    return _CollectedMetric(total, help_text, "counter", [(total, _labels(**labels), value)])
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "ginga_http_requests", "Requests HTTP por rota (template), método e status."
+)
+http_request_duration = registry.histogram(
+    "ginga_http_request_duration_seconds",
+    "Latência das requests por rota (template) e método.",
+    LATENCY_BUCKETS,
+)
+http_in_flight = registry.gauge("ginga_http_requests_in_flight", "Requests em andamento.")
+db_queries = registry.counter("ginga_db_queries", "Statements SQL executados, por rota.")
+db_queries_per_request = registry.histogram(
+    "ginga_db_queries_per_request", "Statements SQL por request, por rota.", QUERY_COUNT_BUCKETS
+)
+db_connection_wait = registry.histogram(
+    "ginga_db_connection_wait_seconds",
+    "Espera para obter conexão do pool (checkout no primeiro SQL da sessão).",
+    LATENCY_BUCKETS,
+)
+
+
+def observe_request(method: str, route: str, status: int, duration_s: float, queries: int) -> None:
+    http_requests.inc(method=method, route=route, status=status)
+    http_request_duration.observe(duration_s, method=method, route=route)
+    db_queries.inc(queries, route=route)
+    db_queries_per_request.observe(queries, route=route)
+
+
+def emit_emf(
+    method: str, route: str, status: int, duration_ms: float, queries: int, db_ms: float
+) -> None:
+    """Uma linha CloudWatch Embedded Metric Format por request (Lambda: stdout -> métricas)."""
+    print(
+        json.dumps(
+            {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": "Ginga/API",
+                            "Dimensions": [["Route"]],
+                            "Metrics": [
+                                {"Name": "Latency", "Unit": "Milliseconds"},
+                                {"Name": "DbQueries", "Unit": "Count"},
+                                {"Name": "DbTime", "Unit": "Milliseconds"},
+                            ],
+                        }
+                    ],
+                },
+                "Route": f"{method} {route}",
+                "Status": status,
+                "Latency": round(duration_ms, 2),
+                "DbQueries": queries,
+                "DbTime": round(db_ms, 2),
+            },
+            ensure_ascii=False,
+        ),
+        flush=True,
+    )
@@ -0,0 +1,24 @@
+"""Resposta JSON serializada com orjson (classe padrão da app).
+
+Rotas quentes retornam `ORJSONResponse(...)` diretamente: o FastAPI não passa o conteúdo
+pelo `jsonable_encoder` (que percorre e copia o dict inteiro) e o orjson serializa
+datetime/date/UUID nativamente, então os services podem devolver esses tipos sem
+`.isoformat()`. Rotas que retornam dict seguem pelo `jsonable_encoder` e depois pelo orjson.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    # Tipos que o orjson não conhece (Decimal, set, modelos Pydantic...): mesmo tratamento
+    # do FastAPI.
+    return jsonable_encoder(value)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -10,6 +10,7 @@ from app.routes import (
     jobs_recruiter,
     me,
     recruiter_applications,
+    recruiter_candidates,
     tags,
     uploads,
 )
@@ -21,6 +22,7 @@ api_router.include_router(jobs_public.router)
 api_router.include_router(jobs_recruiter.router)
 api_router.include_router(applications.router)
 api_router.include_router(recruiter_applications.router)
+api_router.include_router(recruiter_candidates.router)
 api_router.include_router(tags.router)
 api_router.include_router(uploads.router)
 api_router.include_router(dashboard.router)
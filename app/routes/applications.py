@@ -4,8 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.auth import get_current_user
 from app.deps import get_application_service
+from app.responses import ORJSONResponse
 from app.schemas.job import ApplyBody
 from app.services.application_service import ApplicationService
+from app.services.pagination import InvalidCursorError
 
 router = APIRouter(tags=["Applications"])
 
@@ -34,18 +36,45 @@ async def list_applications(
     status_filter: str | None = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco (next_cursor da resposta anterior); tem precedência sobre page",
+    ),
+    include_total: str = Query(
+        "exact",
+        pattern="^(exact|estimate|false)$",
+        description="exact=contagem exata, estimate=estimativa do planner, false=sem total",
+    ),
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa) em cada item"
+    ),
     user: dict = Depends(get_current_user),
     svc: ApplicationService = Depends(get_application_service),
 ):
-    items, total = await svc.list_mine(user["id"], status_filter, page, page_size)
+    try:
+        items, total, next_cursor, has_more = await svc.list_mine(
+            user["id"],
+            status_filter,
+            page,
+            page_size,
+            cursor=cursor,
+            include_total=include_total,
+            include_logo_url=include_logo_url,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
     counts = await svc.counts_by_status(user["id"])
-    return {
-        "results": items,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "counts": counts,
-    }
+    return ORJSONResponse(
+        {
+            "results": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "counts": counts,
+        }
+    )
 
 
 @router.delete("/applications/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -4,8 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.auth import get_current_user
 from app.deps import get_company_service
+from app.responses import ORJSONResponse
 from app.schemas.company import CompanyCreate, CompanyPatch
 from app.services.company_service import CompanyService
+from app.services.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/companies", tags=["Companies"])
 
@@ -13,20 +15,64 @@ router = APIRouter(prefix="/companies", tags=["Companies"])
 @router.get("/public")
 async def list_public_companies(
     q: str | None = Query(None, description="Busca por nome"),
+    sort: str = Query(
+        "name",
+        description="name=ordem alfabética, active_jobs=mais vagas ativas primeiro",
+        pattern="^(name|active_jobs)$",
+    ),
+    min_active_jobs: int | None = Query(
+        None, ge=0, description="Só empresas com pelo menos N vagas ativas"
+    ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco (next_cursor da resposta anterior); tem precedência sobre page",
+    ),
+    include_total: str = Query(
+        "exact",
+        pattern="^(exact|estimate|false)$",
+        description="exact=contagem exata, estimate=estimativa do planner, false=sem total",
+    ),
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa) em cada item"
+    ),
     svc: CompanyService = Depends(get_company_service),
 ):
-    items, total = await svc.list_public(q, page, page_size)
-    return {"companies": items, "total": total, "page": page, "page_size": page_size}
+    try:
+        items, total, next_cursor, has_more = await svc.list_public(
+            q,
+            page,
+            page_size,
+            cursor=cursor,
+            include_total=include_total,
+            include_logo_url=include_logo_url,
+            sort=sort,
+            min_active_jobs=min_active_jobs,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
+    return ORJSONResponse(
+        {
+            "companies": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+    )
 
 
 @router.get("/public/{company_id}")
 async def get_public_company(
     company_id: int,
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa)"
+    ),
     svc: CompanyService = Depends(get_company_service),
 ):
-    data = await svc.get_public(company_id)
+    data = await svc.get_public(company_id, include_logo_url=include_logo_url)
     if not data:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Empresa não encontrada")
     return data
@@ -1,18 +1,23 @@
 """Dashboard helpers (recommended jobs)."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.auth import get_current_user
+from app.dependencies import declare_query_budget
 from app.deps import get_job_service
+from app.responses import ORJSONResponse
 from app.services.job_service import JobService
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
-@router.get("/recommended-jobs")
+@router.get("/recommended-jobs", dependencies=[Depends(declare_query_budget(8))])
 async def recommended_jobs(
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa) em cada item"
+    ),
     user: dict = Depends(get_current_user),
     svc: JobService = Depends(get_job_service),
 ):
-    jobs = await svc.recommended_for_user(user["id"], limit=3)
-    return {"jobs": jobs}
+    jobs = await svc.recommended_for_user(user["id"], limit=3, include_logo_url=include_logo_url)
+    return ORJSONResponse({"jobs": jobs})
@@ -3,15 +3,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.auth import get_current_user_optional
+from app.dependencies import declare_query_budget
 from app.deps import get_job_service
+from app.responses import ORJSONResponse
 from app.services.job_service import JobService
+from app.services.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
-@router.get("")
+# count/estimativa + página + selectinload (empresa, tags) + skills do perfil.
+@router.get("", dependencies=[Depends(declare_query_budget(8))])
 async def list_jobs(
-    q: str | None = Query(None),
+    q: str | None = Query(None, description="Busca textual (título, tags, empresa, descrição)"),
     tag: str | None = Query(None),
     company_id: int | None = Query(None, ge=1),
     page: int = Query(1, ge=1),
@@ -20,34 +24,65 @@ async def list_jobs(
         "recent",
         description=(
             "recent=mais recentes, oldest=mais antigas, "
-            "recommended=recomendadas (skills vs requisitos)"
+            "recommended=recomendadas (skills vs requisitos), "
+            "relevance=relevância da busca `q` (sem `q`, igual a recent)"
         ),
-        pattern="^(recent|oldest|recommended)$",
+        pattern="^(recent|oldest|recommended|relevance)$",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco (next_cursor da resposta anterior); tem precedência sobre page",
+    ),
+    include_total: str = Query(
+        "exact",
+        pattern="^(exact|estimate|false)$",
+        description="exact=contagem exata, estimate=estimativa do planner, false=sem total",
+    ),
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa) em cada item"
     ),
     user: dict | None = Depends(get_current_user_optional),
     svc: JobService = Depends(get_job_service),
 ):
     viewer = user["id"] if user else None
-    items, total = await svc.list_public(
-        q,
-        tag,
-        page,
-        page_size,
-        sort=sort,
-        viewer_id=viewer,
-        company_id=company_id,
+    try:
+        items, total, next_cursor, has_more = await svc.list_public(
+            q,
+            tag,
+            page,
+            page_size,
+            sort=sort,
+            viewer_id=viewer,
+            company_id=company_id,
+            cursor=cursor,
+            include_total=include_total,
+            include_logo_url=include_logo_url,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
+    return ORJSONResponse(
+        {
+            "results": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
     )
-    return {"results": items, "total": total, "page": page, "page_size": page_size}
 
 
-@router.get("/{job_id}")
+@router.get("/{job_id}", dependencies=[Depends(declare_query_budget(5))])
 async def job_detail(
     job_id: int,
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa)"
+    ),
     user: dict | None = Depends(get_current_user_optional),
     svc: JobService = Depends(get_job_service),
 ):
     viewer = user["id"] if user else None
-    data = await svc.get_detail(job_id, viewer)
+    data = await svc.get_detail(job_id, viewer, include_logo_url=include_logo_url)
     if not data:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Vaga não encontrada")
-    return data
+    return ORJSONResponse(data)
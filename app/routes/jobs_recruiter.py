@@ -1,9 +1,10 @@
 """Recruiter job management."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.auth import get_current_user
 from app.deps import get_job_service
+from app.responses import ORJSONResponse
 from app.schemas.job import JobCreate, JobPatch
 from app.services.job_service import JobService
 
@@ -12,10 +13,14 @@ router = APIRouter(prefix="/recruiter/jobs", tags=["Recruiter Jobs"])
 
 @router.get("")
 async def list_recruiter_jobs(
+    include_logo_url: bool = Query(
+        False, description="Inclui logo_url (URL pré-assinada do logo da empresa) em cada item"
+    ),
     user: dict = Depends(get_current_user),
     svc: JobService = Depends(get_job_service),
 ):
-    return {"jobs": await svc.list_recruiter(user["id"])}
+    jobs = await svc.list_recruiter(user["id"], include_logo_url=include_logo_url)
+    return ORJSONResponse({"jobs": jobs})
 
 
 @router.post("/companies/{company_id}", status_code=status.HTTP_201_CREATED)
@@ -7,7 +7,9 @@ from sqlalchemy.exc import IntegrityError
 
 from app.auth import get_current_user
 from app.config import IS_DEVELOPMENT
+from app.dependencies import declare_query_budget
 from app.deps import get_user_service
+from app.responses import ORJSONResponse
 from app.schemas.me import (
     EducationCreate,
     EducationPatch,
@@ -76,7 +78,8 @@ def _http_conflict_from_integrity(exc: IntegrityError) -> HTTPException:
     return HTTPException(status.HTTP_409_CONFLICT, msg)
 
 
-@router.get("")
+# Primeiro acesso: upsert + criação do perfil; depois, 1 query (get_me).
+@router.get("", dependencies=[Depends(declare_query_budget(8))])
 async def get_me(
     user: dict = Depends(get_current_user),
     svc: UserService = Depends(get_user_service),
@@ -90,7 +93,7 @@ async def get_me(
     data = await svc.get_me(user["id"])
     if not data:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Usuário não encontrado")
-    return data
+    return ORJSONResponse(data)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
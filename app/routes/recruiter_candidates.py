@@ -0,0 +1,71 @@
+"""Recruiter candidate search (applicants to the recruiter's jobs)."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.auth import get_current_user
+from app.deps import get_application_service
+from app.responses import ORJSONResponse
+from app.services.application_service import ApplicationService
+from app.services.pagination import InvalidCursorError
+from app.skills import parse_skills
+
+router = APIRouter(prefix="/recruiter/candidates", tags=["Recruiter Candidates"])
+
+
+@router.get("")
+async def search_candidates(
+    skills: str | None = Query(
+        None,
+        description="Skills separadas por vírgula; o candidato precisa ter todas",
+    ),
+    city: str | None = Query(None, max_length=100),
+    education_status: str | None = Query(None, max_length=20),
+    min_experience_years: float | None = Query(None, ge=0, le=60),
+    job_id: int | None = Query(None),
+    company_id: int | None = Query(None),
+    status_filter: str | None = Query(
+        None,
+        alias="status",
+        description="Só candidatos com alguma candidatura neste status",
+    ),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco (next_cursor da resposta anterior); tem precedência sobre page",
+    ),
+    include_total: str = Query(
+        "exact",
+        pattern="^(exact|estimate|false)$",
+        description="exact=contagem exata, estimate=estimativa do planner, false=sem total",
+    ),
+    user: dict = Depends(get_current_user),
+    svc: ApplicationService = Depends(get_application_service),
+):
+    try:
+        items, total, next_cursor, has_more = await svc.search_candidates(
+            user["id"],
+            job_id,
+            company_id,
+            status_filter,
+            [s[:100] for s in parse_skills(skills)],
+            city,
+            education_status,
+            min_experience_years,
+            page,
+            page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
+    return ORJSONResponse(
+        {
+            "results": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+    )
@@ -1,25 +1,42 @@
-"""Presigned S3 upload URLs."""
+"""Presigned S3 upload URLs and the public asset proxy."""
 
+import asyncio
+import mimetypes
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.auth import get_current_user
-from app.services.file_service import PRESIGNED_DOWNLOAD_EXPIRY, FileService
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.auth import get_current_user, get_current_user_optional
+from app.deps import require_public_asset
+from app.schemas.uploads import PresignBatchBody
+from app.services.file_service import (
+    PUBLIC_ASSET_CACHE_CONTROL,
+    PUBLIC_AVATAR_CACHE_CONTROL,
+    VARIANT_CACHE_CONTROL,
+    FileService,
+    is_company_logo_key,
+)
+from app.services.image_variants import (
+    ImageVariantsUnavailable,
+    generate_variants,
+    variant_exists,
+    variant_key,
+)
 
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
 
+# Variante pedida que ainda não existe: serve o original, mas por pouco tempo no cache.
+VARIANT_FALLBACK_CACHE_CONTROL = "public, max-age=300"
+
 
 def _download_payload(s3_key: str) -> dict[str, Any]:
-    url = FileService.presign_download(s3_key)
-    if not url:
+    signed = FileService.presign_download_with_expiry(s3_key)
+    if not signed:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Arquivo não encontrado.")
-    return {"url": url, "expires_in": PRESIGNED_DOWNLOAD_EXPIRY}
-
-
-def _is_company_logo_key(s3_key: str) -> bool:
-    parts = s3_key.strip().split("/")
-    return len(parts) >= 4 and parts[0] == "ginga" and parts[1] == "company_logo"
+    url, expires_in = signed
+    return {"url": url, "expires_in": expires_in}
 
 
 def _user_owns_s3_key(user_id: str, s3_key: str) -> bool:
@@ -63,8 +80,116 @@ async def presign_view_url(
     return _download_payload(s3_key)
 
 
+@router.post("/presign-batch")
+async def presign_batch(
+    body: PresignBatchBody,
+    user: dict | None = Depends(get_current_user_optional),
+):
+    """URLs de exibição de várias chaves numa chamada (logos de empresa para qualquer um;
+    avatar/logo do próprio usuário se autenticado). Falhas vêm por chave em `errors`.
+
+    Com `variant`, assina a versão redimensionada das chaves que já a têm (`variant` no
+    item diz qual foi usada) e o original das demais.
+    """
+    uid = user["id"] if user else None
+    allowed: list[str] = []
+    errors: dict[str, str] = {}
+    for raw in body.s3_keys:
+        s3_key = raw.strip()
+        if not s3_key or s3_key in allowed or s3_key in errors:
+            continue
+        if is_company_logo_key(s3_key) or (uid and _user_owns_s3_key(uid, s3_key)):
+            allowed.append(s3_key)
+        else:
+            errors[s3_key] = "Sem permissão para este arquivo."
+    has_variant = [False] * len(allowed)
+    if body.variant:
+        has_variant = await asyncio.gather(
+            *(run_in_threadpool(variant_exists, k, body.variant) for k in allowed)
+        )
+    urls: dict[str, dict[str, Any]] = {}
+    for s3_key, use_variant in zip(allowed, has_variant, strict=True):
+        target = variant_key(s3_key, body.variant) if use_variant else s3_key
+        signed = FileService.presign_download_with_expiry(target)
+        if not signed:
+            errors[s3_key] = "Arquivo não encontrado."
+            continue
+        url, expires_in = signed
+        urls[s3_key] = {
+            "url": url,
+            "expires_in": expires_in,
+            "variant": body.variant if use_variant else None,
+        }
+    return {"urls": urls, "errors": errors}
+
+
+@router.post("/variants")
+async def create_variants(
+    s3_key: str = Query(..., min_length=1),
+    force: bool = Query(False, description="Regera mesmo se as variantes já existirem"),
+    user: dict = Depends(get_current_user),
+):
+    """Gera as variantes WebP (thumb, medium) de um avatar/logo recém-enviado; chamar
+    depois do PUT na URL de /uploads/presign. Idempotente."""
+    if not _user_owns_s3_key(user["id"], s3_key):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Sem permissão para este arquivo.")
+    try:
+        return await generate_variants(s3_key, force=force)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
+    except LookupError as e:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(e)) from e
+    except ImageVariantsUnavailable as e:
+        raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, str(e)) from e
+
+
 @router.get("/company-logo-url")
 async def company_logo_display_url(s3_key: str = Query(..., min_length=1)):
-    if not _is_company_logo_key(s3_key):
+    if not is_company_logo_key(s3_key):
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Chave inválida.")
     return _download_payload(s3_key)
+
+
+@router.get("/public/{s3_key:path}", dependencies=[Depends(require_public_asset)])
+async def public_asset(
+    s3_key: str,
+    request: Request,
+    variant: str | None = Query(
+        None,
+        pattern="^(thumb|medium)$",
+        description="Versão redimensionada (WebP); cai para o original se ainda não existe",
+    ),
+):
+    """Logo de empresa / avatar de perfil publicado por URL estável (cacheável por navegador
+    e CDN, ao contrário das URLs pré-assinadas, que mudam a cada assinatura).
+
+    Só logos são `immutable` por um ano; avatares usam cache curto, para que despublicar o
+    perfil ou trocar a foto tire a imagem de circulação em minutos.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    is_logo = is_company_logo_key(s3_key)
+    cache_control = PUBLIC_ASSET_CACHE_CONTROL if is_logo else PUBLIC_AVATAR_CACHE_CONTROL
+    obj = None
+    if variant:
+        obj = await run_in_threadpool(
+            FileService.open_public_object, variant_key(s3_key, variant), if_none_match
+        )
+        if is_logo:
+            # Variante pode ser regerada (force) na mesma chave: nunca immutable.
+            cache_control = VARIANT_CACHE_CONTROL if obj else VARIANT_FALLBACK_CACHE_CONTROL
+    if obj is None:
+        obj = await run_in_threadpool(FileService.open_public_object, s3_key, if_none_match)
+    if obj is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Arquivo não encontrado.")
+    headers = {"Cache-Control": cache_control}
+    if obj["etag"]:
+        headers["ETag"] = obj["etag"]
+    if obj["not_modified"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    media_type = obj["content_type"]
+    if media_type == "application/octet-stream":
+        # Uploads pré-assinados gravam octet-stream; a extensão da chave diz o tipo real.
+        media_type = mimetypes.guess_type(s3_key)[0] or media_type
+    if obj["content_length"] is not None:
+        headers["Content-Length"] = str(obj["content_length"])
+    return StreamingResponse(obj["chunks"], media_type=media_type, headers=headers)
@@ -0,0 +1,11 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+PRESIGN_BATCH_MAX_KEYS = 100
+
+
+class PresignBatchBody(BaseModel):
+    s3_keys: list[str] = Field(..., min_length=1, max_length=PRESIGN_BATCH_MAX_KEYS)
+    # Variante redimensionada (quando já gerada; senão assina o original).
+    variant: Literal["thumb", "medium"] | None = None
@@ -1,12 +1,35 @@
 """Job applications."""
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select, tuple_
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database.models import Application, Company, Job, User
+from app.database.models import (
+    Application,
+    Company,
+    Education,
+    Job,
+    ProfessionalExperience,
+    Profile,
+    User,
+)
+from app.services.file_service import with_logo_url
+from app.services.pagination import (
+    ListPage,
+    count_total,
+    cursor_created_at_id,
+    decode_cursor,
+    encode_cursor,
+)
+
+APPLICATION_STATUSES = ("applied", "interviewing", "approved", "rejected")
+
+DAYS_PER_YEAR = 365.25
 
 
 class ApplicationService:
@@ -49,12 +72,14 @@ class ApplicationService:
         status_filter: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict[str, Any]], int]:
+        cursor: str | None = None,
+        include_total: str = "exact",
+        include_logo_url: bool = False,
+    ) -> ListPage:
         id_stmt = select(Application.id).where(Application.user_id == user_id)
         if status_filter:
             id_stmt = id_stmt.where(Application.status == status_filter)
         subq = id_stmt.subquery()
-        total = await self.session.scalar(select(func.count()).select_from(subq))
 
         stmt = (
             select(Application)
@@ -63,10 +88,10 @@ class ApplicationService:
             )
             .where(Application.id.in_(select(subq.c.id)))
         )
-        stmt = stmt.order_by(Application.created_at.desc())
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = self._paginate_recent_first(stmt, page, page_size, cursor)
+        total = await count_total(self.session, id_stmt, include_total)
         result = await self.session.execute(stmt)
-        rows = result.scalars().unique().all()
+        rows, next_cursor = self._split_page(result.scalars().unique().all(), page_size)
         out = []
         for a in rows:
             j = a.job
@@ -75,20 +100,44 @@ class ApplicationService:
                     "id": a.id,
                     "status": a.status,
                     "cover_letter": a.cover_letter,
-                    "applied_at": a.created_at.isoformat() if a.created_at else None,
+                    "applied_at": a.created_at,
                     "job": {
                         "id": j.id,
                         "title": j.title,
                         "is_active": j.is_active,
-                        "company": {
-                            "id": j.company.id,
-                            "name": j.company.name,
-                            "logo_s3_key": j.company.logo_s3_key,
-                        },
+                        "company": with_logo_url(
+                            {
+                                "id": j.company.id,
+                                "name": j.company.name,
+                                "logo_s3_key": j.company.logo_s3_key,
+                            },
+                            include_logo_url,
+                        ),
                     },
                 }
             )
-        return out, int(total or 0)
+        return ListPage(out, total, next_cursor, next_cursor is not None)
+
+    @staticmethod
+    def _paginate_recent_first(stmt, page: int, page_size: int, cursor: str | None):
+        """Ordena por (created_at, id) desc; cursor (keyset) tem precedência sobre page."""
+        stmt = stmt.order_by(Application.created_at.desc(), Application.id.desc())
+        if cursor:
+            stmt = stmt.where(
+                tuple_(Application.created_at, Application.id) < cursor_created_at_id(cursor)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        return stmt.limit(page_size + 1)
+
+    @staticmethod
+    def _split_page(
+        rows: Sequence[Application], page_size: int
+    ) -> tuple[Sequence[Application], str | None]:
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
 
     async def withdraw(self, user_id: str, application_id: int) -> bool:
         result = await self.session.execute(
@@ -113,12 +162,27 @@ class ApplicationService:
         )
         result = await self.session.execute(stmt)
         rows = result.all()
-        base = {"applied": 0, "interviewing": 0, "approved": 0, "rejected": 0}
+        base = dict.fromkeys(APPLICATION_STATUSES, 0)
         for status, cnt in rows:
             if status in base:
                 base[status] = int(cnt)
         return base
 
+    async def counts_by_job(self, job_ids: Sequence[int]) -> dict[int, dict[str, int]]:
+        """Candidaturas por status de cada vaga, numa única query agrupada (job_id, status)."""
+        out = {jid: dict.fromkeys(APPLICATION_STATUSES, 0) for jid in job_ids}
+        if not out:
+            return out
+        result = await self.session.execute(
+            select(Application.job_id, Application.status, func.count())
+            .where(Application.job_id.in_(list(out)))
+            .group_by(Application.job_id, Application.status)
+        )
+        for job_id, status, cnt in result.all():
+            if status in out[job_id]:
+                out[job_id][status] = int(cnt)
+        return out
+
     def _recruiter_application_filters(
         self,
         owner_id: str,
@@ -148,10 +212,11 @@ class ApplicationService:
         status_filter: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict[str, Any]], int]:
+        cursor: str | None = None,
+        include_total: str = "exact",
+        include_logo_url: bool = False,
+    ) -> ListPage:
         id_stmt = self._recruiter_application_filters(owner_id, job_id, company_id, status_filter)
-        subq = id_stmt.subquery()
-        total = await self.session.scalar(select(func.count()).select_from(subq))
 
         stmt = (
             select(Application)
@@ -169,13 +234,10 @@ class ApplicationService:
             stmt = stmt.where(Job.company_id == company_id)
         if status_filter:
             stmt = stmt.where(Application.status == status_filter)
-        stmt = (
-            stmt.order_by(Application.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
+        stmt = self._paginate_recent_first(stmt, page, page_size, cursor)
+        total = await count_total(self.session, id_stmt, include_total)
         result = await self.session.execute(stmt)
-        rows = result.scalars().unique().all()
+        rows, next_cursor = self._split_page(result.scalars().unique().all(), page_size)
         out: list[dict[str, Any]] = []
         for a in rows:
             j = a.job
@@ -186,7 +248,7 @@ class ApplicationService:
                 {
                     "id": a.id,
                     "status": a.status,
-                    "applied_at": a.created_at.isoformat() if a.created_at else None,
+                    "applied_at": a.created_at,
                     "cover_letter": a.cover_letter,
                     "feedback_text": a.feedback_text,
                     "candidate": {
@@ -198,15 +260,137 @@ class ApplicationService:
                         "id": j.id,
                         "title": j.title,
                         "is_active": j.is_active,
-                        "company": {
-                            "id": j.company.id,
-                            "name": j.company.name,
-                            "logo_s3_key": j.company.logo_s3_key,
-                        },
+                        "company": with_logo_url(
+                            {
+                                "id": j.company.id,
+                                "name": j.company.name,
+                                "logo_s3_key": j.company.logo_s3_key,
+                            },
+                            include_logo_url,
+                        ),
                     },
                 }
             )
-        return out, int(total or 0)
+        return ListPage(out, total, next_cursor, next_cursor is not None)
+
+    async def search_candidates(
+        self,
+        owner_id: str,
+        job_id: int | None,
+        company_id: int | None,
+        status_filter: str | None,
+        skills: list[str],
+        city: str | None,
+        education_status: str | None,
+        min_experience_years: float | None,
+        page: int,
+        page_size: int,
+        cursor: str | None = None,
+        include_total: str = "exact",
+    ) -> ListPage:
+        """Candidatos (um por usuário) às vagas do recrutador, com filtros do perfil.
+
+        - skills: o perfil precisa ter todas (skill_list @> ..., índice GIN);
+        - city: igualdade sem diferenciar maiúsculas (índice em lower(city));
+        - education_status: alguma formação com esse status;
+        - min_experience_years: soma das experiências (em aberto conta até hoje;
+          períodos sobrepostos somam duas vezes).
+        Ordenado pela candidatura mais recente; cursor (keyset) tem precedência sobre page.
+        """
+        applicants = (
+            self._recruiter_application_filters(owner_id, job_id, company_id, status_filter)
+            .with_only_columns(
+                Application.user_id,
+                func.max(Application.created_at).label("last_applied_at"),
+                func.count().label("applications_count"),
+            )
+            .group_by(Application.user_id)
+            .subquery("applicants")
+        )
+        experience_days = (
+            select(
+                func.coalesce(
+                    func.sum(
+                        func.coalesce(ProfessionalExperience.end_date, func.current_date())
+                        - ProfessionalExperience.start_date
+                    ),
+                    0,
+                )
+            )
+            .where(ProfessionalExperience.profile_user_id == applicants.c.user_id)
+            .scalar_subquery()
+        )
+
+        filters: list[Any] = []
+        if skills:
+            filters.append(Profile.skill_list.contains(array(skills)))
+        if city and city.strip():
+            filters.append(func.lower(Profile.city) == city.strip().lower())
+        if education_status:
+            filters.append(
+                exists().where(
+                    Education.profile_user_id == applicants.c.user_id,
+                    Education.status == education_status,
+                )
+            )
+        if min_experience_years:
+            filters.append(experience_days >= min_experience_years * DAYS_PER_YEAR)
+
+        def _from(stmt):
+            stmt = stmt.select_from(applicants).join(User, User.id == applicants.c.user_id)
+            return stmt.outerjoin(Profile, Profile.user_id == applicants.c.user_id).where(
+                *filters
+            )
+
+        stmt = _from(
+            select(
+                applicants.c.user_id,
+                applicants.c.last_applied_at,
+                applicants.c.applications_count,
+                User.email,
+                User.first_name,
+                User.last_name,
+                Profile.slug,
+                Profile.city,
+                Profile.skill_list,
+                Profile.avatar_s3_key,
+                experience_days.label("experience_days"),
+            )
+        ).order_by(applicants.c.last_applied_at.desc(), applicants.c.user_id.desc())
+        if cursor:
+            after = decode_cursor(cursor, datetime.fromisoformat, str)
+            stmt = stmt.where(
+                tuple_(applicants.c.last_applied_at, applicants.c.user_id) < after
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        total = await count_total(self.session, _from(select(applicants.c.user_id)), include_total)
+        result = await self.session.execute(stmt.limit(page_size + 1))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(rows[-1].last_applied_at, rows[-1].user_id)
+        out = []
+        for r in rows:
+            name_parts = [r.first_name or "", r.last_name or ""]
+            display = " ".join(p for p in name_parts if p).strip() or (r.email or "Candidato")
+            out.append(
+                {
+                    "id": r.user_id,
+                    "email": r.email,
+                    "display_name": display,
+                    "slug": r.slug,
+                    "city": r.city,
+                    "skills": list(r.skill_list or []),
+                    "avatar_s3_key": r.avatar_s3_key,
+                    "experience_years": round(int(r.experience_days or 0) / DAYS_PER_YEAR, 1),
+                    "applications_count": int(r.applications_count),
+                    "last_applied_at": r.last_applied_at,
+                }
+            )
+        return ListPage(out, total, next_cursor, next_cursor is not None)
 
     async def recruiter_update_status(
         self,
@@ -215,8 +399,7 @@ class ApplicationService:
         new_status: str,
         feedback_text: str,
     ) -> dict[str, Any] | None:
-        allowed = {"applied", "interviewing", "approved", "rejected"}
-        if new_status not in allowed:
+        if new_status not in APPLICATION_STATUSES:
             return None
         result = await self.session.execute(
             select(Application)
@@ -242,7 +425,7 @@ class ApplicationService:
         return {
             "id": app.id,
             "status": app.status,
-            "applied_at": app.created_at.isoformat() if app.created_at else None,
+            "applied_at": app.created_at,
             "cover_letter": app.cover_letter,
             "feedback_text": app.feedback_text,
             "candidate": {
@@ -2,11 +2,16 @@
 
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database.models import Application, Company, Job
+from app.database.models import Company, Job
+from app.services.application_service import ApplicationService
+from app.services.file_service import with_logo_url
+from app.services.image_variants import generate_variants_on_save
+from app.services.job_service import refresh_job_search_vectors
+from app.services.pagination import ListPage, count_total, decode_cursor, encode_cursor
 
 
 class CompanyService:
@@ -21,22 +26,22 @@ class CompanyService:
             .order_by(Company.name)
         )
         companies = result.scalars().unique().all()
+        counts = await ApplicationService(self.session).counts_by_job(
+            [j.id for c in companies for j in c.jobs]
+        )
         out = []
         for c in companies:
             job_rows = []
             for j in c.jobs:
-                cnt = await self.session.scalar(
-                    select(func.count())
-                    .select_from(Application)
-                    .where(Application.job_id == j.id)
-                )
+                by_status = counts[j.id]
                 job_rows.append(
                     {
                         "id": j.id,
                         "title": j.title,
                         "is_active": j.is_active,
-                        "applications_count": int(cnt or 0),
-                        "created_at": j.created_at.isoformat() if j.created_at else None,
+                        "applications_count": sum(by_status.values()),
+                        "applications_by_status": by_status,
+                        "created_at": j.created_at,
                     }
                 )
             out.append(
@@ -80,6 +85,8 @@ class CompanyService:
         self.session.add(c)
         await self.session.flush()
         await self.session.refresh(c)
+        if c.logo_s3_key:
+            await generate_variants_on_save(c.logo_s3_key)
         return {"id": c.id}
 
     async def update(
@@ -91,6 +98,8 @@ class CompanyService:
         c = result.scalar_one_or_none()
         if not c:
             return None
+        old_name = c.name
+        old_logo = c.logo_s3_key
         for k in ("name", "cnpj", "website", "description", "logo_s3_key"):
             if k not in data:
                 continue
@@ -99,6 +108,11 @@ class CompanyService:
                 val = ""
             setattr(c, k, val)
         await self.session.flush()
+        if c.name != old_name:
+            # Nome da empresa entra no search_vector das vagas (peso C).
+            await refresh_job_search_vectors(self.session, Job.company_id == c.id)
+        if c.logo_s3_key and c.logo_s3_key != old_logo:
+            await generate_variants_on_save(c.logo_s3_key)
         return await self.get(company_id, owner_id)
 
     async def delete(self, company_id: int, owner_id: str) -> bool:
@@ -123,60 +137,100 @@ class CompanyService:
         q: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict[str, Any]], int]:
-        """Catálogo público de empresas (nome, descrição resumida, contagem de vagas ativas)."""
+        cursor: str | None = None,
+        include_total: str = "exact",
+        sort: str = "name",
+        min_active_jobs: int | None = None,
+        include_logo_url: bool = False,
+    ) -> ListPage:
+        """Catálogo público de empresas (nome, descrição resumida, contagem de vagas ativas).
+
+        sort=name (A-Z) ou active_jobs (mais vagas ativas primeiro); ambos paginam por cursor.
+        """
         filters = []
         if q and q.strip():
             filters.append(Company.name.ilike(f"%{q.strip()}%"))
-        stmt_count = select(func.count()).select_from(Company)
-        if filters:
-            stmt_count = stmt_count.where(*filters)
-        total = await self.session.scalar(stmt_count)
-        stmt = select(Company).order_by(Company.name)
+        if min_active_jobs:
+            filters.append(Company.active_jobs_count >= min_active_jobs)
+        by_jobs = sort == "active_jobs"
+        if by_jobs:
+            stmt = select(Company).order_by(Company.active_jobs_count.desc(), Company.id.desc())
+        else:
+            stmt = select(Company).order_by(Company.name, Company.id)
         if filters:
             stmt = stmt.where(*filters)
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        result = await self.session.execute(stmt)
+        if cursor:
+            if by_jobs:
+                after = decode_cursor(cursor, int, int)
+                stmt = stmt.where(tuple_(Company.active_jobs_count, Company.id) < after)
+            else:
+                after = decode_cursor(cursor, str, int)
+                stmt = stmt.where(tuple_(Company.name, Company.id) > after)
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        # Depois do cursor: cursor inválido vira 400 sem gastar a contagem.
+        total = await count_total(self.session, select(Company.id).where(*filters), include_total)
+        result = await self.session.execute(stmt.limit(page_size + 1))
         rows = result.scalars().all()
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                last.active_jobs_count if by_jobs else last.name,
+                last.id,
+            )
         out: list[dict[str, Any]] = []
         for c in rows:
-            active_cnt = await self.session.scalar(
-                select(func.count()).select_from(Job).where(
-                    Job.company_id == c.id,
-                    Job.is_active.is_(True),
-                )
-            )
             desc = (c.description or "").strip()
             if len(desc) > 280:
                 desc = desc[:277] + "…"
             out.append(
-                {
-                    "id": c.id,
-                    "name": c.name,
-                    "description_preview": desc,
-                    "website": c.website or "",
-                    "logo_s3_key": c.logo_s3_key,
-                    "active_jobs_count": int(active_cnt or 0),
-                }
+                with_logo_url(
+                    {
+                        "id": c.id,
+                        "name": c.name,
+                        "description_preview": desc,
+                        "website": c.website or "",
+                        "logo_s3_key": c.logo_s3_key,
+                        "active_jobs_count": c.active_jobs_count,
+                    },
+                    include_logo_url,
+                )
             )
-        return out, int(total or 0)
+        return ListPage(out, total, next_cursor, next_cursor is not None)
 
-    async def get_public(self, company_id: int) -> dict[str, Any] | None:
+    async def get_public(
+        self, company_id: int, include_logo_url: bool = False
+    ) -> dict[str, Any] | None:
         result = await self.session.execute(select(Company).where(Company.id == company_id))
         c = result.scalar_one_or_none()
         if not c:
             return None
-        active_cnt = await self.session.scalar(
-            select(func.count()).select_from(Job).where(
-                Job.company_id == c.id,
-                Job.is_active.is_(True),
-            )
+        return with_logo_url(
+            {
+                "id": c.id,
+                "name": c.name,
+                "description": c.description or "",
+                "website": c.website or "",
+                "logo_s3_key": c.logo_s3_key,
+                "active_jobs_count": c.active_jobs_count,
+            },
+            include_logo_url,
         )
-        return {
-            "id": c.id,
-            "name": c.name,
-            "description": c.description or "",
-            "website": c.website or "",
-            "logo_s3_key": c.logo_s3_key,
-            "active_jobs_count": int(active_cnt or 0),
-        }
+
+    async def reconcile_active_jobs_counts(self) -> int:
+        """Recalcula active_jobs_count a partir de api_jobs; retorna quantas empresas mudaram."""
+        actual = (
+            select(func.count())
+            .select_from(Job)
+            .where(Job.company_id == Company.id, Job.is_active.is_(True))
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(Company)
+            .where(Company.active_jobs_count != actual)
+            .values(active_jobs_count=actual, updated_at=Company.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
@@ -1,13 +1,19 @@
 """S3 presigned URLs for uploads and downloads."""
 
 import logging
+import threading
+import time
 import uuid
+from collections.abc import Iterator
 from typing import Any
+from urllib.parse import quote
 
 import boto3
 from botocore.exceptions import ClientError
 
-from app.config import S3_BUCKET_NAME, S3_REGION
+from app.cache import TTLCache
+from app.config import PUBLIC_ASSET_BASE_URL, S3_BUCKET_NAME, S3_ENDPOINT_URL, S3_REGION
+from app.metrics import counter_value, gauge_value, registry
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +21,84 @@ ALLOWED_IMAGE_EXT = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 ALLOWED_DOC_EXT = {".pdf", ".doc", ".docx"}
 PRESIGNED_UPLOAD_EXPIRY = 300
 PRESIGNED_DOWNLOAD_EXPIRY = 3600
+# URL de download pré-assinada é reaproveitada enquanto faltar mais que isso para expirar.
+PRESIGN_REUSE_MARGIN = 600
+PRESIGN_CACHE_SIZE = 10000
+# Chaves levam um uuid (presign_upload): o conteúdo de uma chave nunca muda.
+PUBLIC_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Avatar deixa de ser público ao despublicar o perfil ou trocar a foto: cache curto.
+PUBLIC_AVATAR_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+# Variantes de logo: a chave deriva do original e `force` regrava no mesmo lugar, então
+# nada de immutable.
+VARIANT_CACHE_CONTROL = "public, max-age=86400"
+# Variante (app.services.image_variants) pedida pelo logo_url das listagens no modo proxy.
+LISTING_LOGO_VARIANT = "thumb"
+PUBLIC_ASSET_CHUNK_SIZE = 64 * 1024
+
+_s3 = None
+_s3_lock = threading.Lock()
+# s3_key -> (url, expira_em epoch); TTL já desconta a margem.
+_download_urls = TTLCache(
+    maxsize=PRESIGN_CACHE_SIZE, ttl=PRESIGNED_DOWNLOAD_EXPIRY - PRESIGN_REUSE_MARGIN
+)
 
 
 def _client():
-    return boto3.client("s3", region_name=S3_REGION)
+    """Cliente S3 único por processo (criar um custa ms: carrega modelos do botocore e
+    resolve credenciais). Clientes boto3 são thread-safe; a criação não, daí o lock."""
+    global _s3
+    if _s3 is None:
+        with _s3_lock:
+            if _s3 is None:
+                _s3 = boto3.client(
+                    "s3", region_name=S3_REGION, endpoint_url=S3_ENDPOINT_URL or None
+                )
+    return _s3
+
+
+def is_company_logo_key(s3_key: str) -> bool:
+    parts = s3_key.strip().split("/")
+    return len(parts) >= 4 and parts[0] == "ginga" and parts[1] == "company_logo"
+
+
+def is_avatar_key(s3_key: str) -> bool:
+    parts = s3_key.strip().split("/")
+    return len(parts) >= 4 and parts[0] == "ginga" and parts[1] == "avatar"
+
+
+def public_asset_url(s3_key: str, variant: str | None = None) -> str:
+    """URL estável do proxy público (requer PUBLIC_ASSET_BASE_URL)."""
+    url = f"{PUBLIC_ASSET_BASE_URL}/{quote(s3_key)}"
+    return f"{url}?variant={variant}" if variant else url
+
+
+def company_logo_url(s3_key: str | None) -> str | None:
+    """URL de exibição do logo para embutir nas listagens (None sem logo ou chave inválida)."""
+    if not s3_key or not is_company_logo_key(s3_key):
+        return None
+    if PUBLIC_ASSET_BASE_URL:
+        # O proxy cai para o original enquanto a variante não existe.
+        return public_asset_url(s3_key, LISTING_LOGO_VARIANT)
+    return FileService.presign_download(s3_key)
+
+
+def with_logo_url(row: dict[str, Any], include: bool) -> dict[str, Any]:
+    """Acrescenta `logo_url` ao dict (empresa) que já tem `logo_s3_key`, se pedido."""
+    if include:
+        row["logo_url"] = company_logo_url(row.get("logo_s3_key"))
+    return row
+
+
+@registry.register_collector
+def _presign_metrics():
+    stats = _download_urls.stats()
+    return [
+        counter_value(
+            "ginga_presign_cache_hits", "URLs de download reaproveitadas.", stats["hits"]
+        ),
+        counter_value("ginga_presign_cache_misses", "URLs de download assinadas.", stats["misses"]),
+        gauge_value("ginga_presign_cache_size", "URLs de download em cache.", stats["size"]),
+    ]
 
 
 class FileService:
@@ -65,11 +145,22 @@ class FileService:
 
     @staticmethod
     def presign_download(s3_key: str | None) -> str | None:
+        signed = FileService.presign_download_with_expiry(s3_key)
+        return signed[0] if signed else None
+
+    @staticmethod
+    def presign_download_with_expiry(s3_key: str | None) -> tuple[str, int] | None:
+        """(url, segundos até expirar). Reaproveita a URL assinada da mesma chave até
+        PRESIGN_REUSE_MARGIN antes de expirar (o navegador também cacheia a imagem pela URL)."""
         if not s3_key or not S3_BUCKET_NAME:
             return None
+        cached = _download_urls.get(s3_key)
+        if cached is not None:
+            url, expires_at = cached
+            return url, int(expires_at - time.time())
         s3 = _client()
         try:
-            return s3.generate_presigned_url(
+            url = s3.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": S3_BUCKET_NAME, "Key": s3_key},
                 ExpiresIn=PRESIGNED_DOWNLOAD_EXPIRY,
@@ -77,6 +168,61 @@ class FileService:
         except ClientError as e:
             logger.error("presign download: %s", e)
             return None
+        _download_urls.set(s3_key, (url, time.time() + PRESIGNED_DOWNLOAD_EXPIRY))
+        return url, PRESIGNED_DOWNLOAD_EXPIRY
+
+    @staticmethod
+    def open_public_object(s3_key: str, if_none_match: str | None = None) -> dict[str, Any] | None:
+        """GetObject para o proxy de assets públicos (bloqueante: chamar no threadpool).
+
+        None se a chave não existe; {"not_modified": True, "etag"} se o ETag bate com
+        If-None-Match (o próprio S3 responde 304, sem corpo); senão metadados + `chunks`.
+        """
+        if not S3_BUCKET_NAME:
+            return None
+        params: dict[str, Any] = {"Bucket": S3_BUCKET_NAME, "Key": s3_key}
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+        try:
+            obj = _client().get_object(**params)
+        except ClientError as e:
+            status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status_code == 304:
+                return {"not_modified": True, "etag": if_none_match}
+            if status_code not in (403, 404):
+                logger.error("get public object: %s", e)
+            return None
+        return {
+            "not_modified": False,
+            "etag": obj.get("ETag"),
+            "content_type": obj.get("ContentType") or "application/octet-stream",
+            "content_length": obj.get("ContentLength"),
+            "chunks": _iter_body(obj["Body"]),
+        }
+
+    @staticmethod
+    def read_object(s3_key: str, max_bytes: int) -> bytes | None:
+        """Conteúdo do objeto (bloqueante); None se não existe ou passa de max_bytes."""
+        if not S3_BUCKET_NAME:
+            return None
+        try:
+            obj = _client().get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+        except ClientError:
+            return None
+        with obj["Body"] as body:
+            if (obj.get("ContentLength") or 0) > max_bytes:
+                return None
+            return body.read()
+
+    @staticmethod
+    def write_object(s3_key: str, data: bytes, content_type: str, cache_control: str) -> None:
+        _client().put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=s3_key,
+            Body=data,
+            ContentType=content_type,
+            CacheControl=cache_control,
+        )
 
     @staticmethod
     def head_object(s3_key: str) -> bool:
@@ -87,3 +233,10 @@ class FileService:
             return True
         except ClientError:
             return False
+
+
+def _iter_body(body) -> Iterator[bytes]:
+    try:
+        yield from body.iter_chunks(PUBLIC_ASSET_CHUNK_SIZE)
+    finally:
+        body.close()
@@ -0,0 +1,205 @@
+"""Variantes redimensionadas (WebP) de avatares e logos, gravadas ao lado do original.
+
+`ginga/company_logo/<owner>/<uuid>.png` ganha `<uuid>__thumb.webp` e `<uuid>__medium.webp`
+no mesmo prefixo. São geradas ao salvar o avatar/logo (UserService.update_me e
+CompanyService.create/update), por POST /uploads/variants ou pelo script de backfill.
+Sempre dentro da request, antes da resposta: na Lambda nada garante que trabalho depois
+da resposta (background task, teardown de dependência) chegue a rodar. O redimensionamento
+(Pillow, extra opcional `images`) roda num ProcessPoolExecutor para não disputar o GIL com
+o event loop; com IMAGE_VARIANT_WORKERS=0 usa threads. Reprocessar é idempotente: variantes
+já existentes são puladas (a chave do original nunca muda de conteúdo), a menos que
+`force=True`, que regrava na mesma chave (por isso variantes não levam Cache-Control
+immutable).
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+from app.cache import TTLCache
+from app.config import IMAGE_VARIANT_WORKERS, MAX_FILE_SIZE, S3_BUCKET_NAME
+from app.services.file_service import (
+    ALLOWED_IMAGE_EXT,
+    PUBLIC_AVATAR_CACHE_CONTROL,
+    VARIANT_CACHE_CONTROL,
+    FileService,
+    is_company_logo_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maior lado em px. thumb cobre os quadros de 48-80px das listagens em telas 2x.
+VARIANTS = {"thumb": 160, "medium": 640}
+VARIANT_FORMAT = "webp"
+VARIANT_CONTENT_TYPE = "image/webp"
+WEBP_QUALITY = 80
+VARIANT_PURPOSES = ("avatar", "company_logo")
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+# variant_key -> existe? (evita um HEAD no S3 a cada pedido da mesma variante)
+_exists_cache = TTLCache(maxsize=10000, ttl=300)
+
+
+class ImageVariantsUnavailable(RuntimeError):
+    """Pillow não instalado (uv sync --extra images) ou bucket não configurado."""
+
+
+def variant_key(s3_key: str, variant: str) -> str:
+    name = s3_key.rsplit("/", 1)[-1]
+    base = s3_key.rsplit(".", 1)[0] if "." in name else s3_key
+    return f"{base}__{variant}.{VARIANT_FORMAT}"
+
+
+def is_variant_source(s3_key: str) -> bool:
+    parts = s3_key.split("/")
+    name = parts[-1]
+    ext = "." + name.rsplit(".", 1)[-1].lower() if "." in name else ""
+    return (
+        len(parts) >= 4
+        and parts[0] == "ginga"
+        and parts[1] in VARIANT_PURPOSES
+        and ext in ALLOWED_IMAGE_EXT
+        and "__" not in name
+    )
+
+
+def variant_exists(s3_key: str, variant: str) -> bool:
+    """HEAD da variante, em cache por alguns minutos (bloqueante)."""
+    key = variant_key(s3_key, variant)
+    cached = _exists_cache.get(key)
+    if cached is None:
+        cached = FileService.head_object(key)
+        _exists_cache.set(key, cached)
+    return cached
+
+
+def _render_variants(data: bytes, sizes: dict[str, int]) -> dict[str, bytes]:
+    """Roda no processo do pool: decodifica uma vez e gera cada tamanho em WebP."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as src:
+        largest = max(sizes.values())
+        # JPEG: decodifica já reduzido (bem mais rápido para fotos grandes).
+        src.draft("RGB", (largest * 2, largest * 2))
+        img = ImageOps.exif_transpose(src)
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+    out = {}
+    for name, size in sizes.items():
+        resized = img.copy()
+        resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        resized.save(buf, VARIANT_FORMAT, quality=WEBP_QUALITY, method=4)
+        out[name] = buf.getvalue()
+    return out
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if IMAGE_VARIANT_WORKERS > 0:
+                    # Nunca fork: o worker do uvicorn tem threads (threadpool, boto3) e um
+                    # filho com fork pode herdar locks presos. forkserver/spawn importam só
+                    # este módulo no processo novo.
+                    methods = multiprocessing.get_all_start_methods()
+                    method = "forkserver" if "forkserver" in methods else "spawn"
+                    try:
+                        _executor = ProcessPoolExecutor(
+                            max_workers=IMAGE_VARIANT_WORKERS,
+                            mp_context=multiprocessing.get_context(method),
+                        )
+                    except (OSError, NotImplementedError) as e:
+                        logger.warning("process pool unavailable, using threads: %s", e)
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="img")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def generate_variants(s3_key: str, force: bool = False) -> dict[str, Any]:
+    """Gera (ou confirma) as variantes de `s3_key`; retorna as chaves e o que foi criado.
+
+    Levanta ValueError para chave que não é avatar/logo ou arquivo que não decodifica como
+    imagem (corrompido, outro formato com extensão de imagem, bomba de descompressão) e
+    LookupError se o original não existe.
+    """
+    if not is_variant_source(s3_key):
+        raise ValueError("Chave não é um avatar/logo de imagem.")
+    if not _pillow_available() or not S3_BUCKET_NAME:
+        raise ImageVariantsUnavailable("Geração de variantes indisponível.")
+    keys = {name: variant_key(s3_key, name) for name in VARIANTS}
+    if force:
+        missing = dict(VARIANTS)
+    else:
+        exists = await asyncio.gather(
+            *(run_in_threadpool(FileService.head_object, k) for k in keys.values())
+        )
+        missing = {n: VARIANTS[n] for n, ok in zip(keys, exists, strict=True) if not ok}
+    if missing:
+        data = await run_in_threadpool(FileService.read_object, s3_key, MAX_FILE_SIZE)
+        if data is None:
+            raise LookupError("Arquivo não encontrado.")
+        from PIL import Image
+
+        loop = asyncio.get_running_loop()
+        try:
+            rendered = await loop.run_in_executor(_get_executor(), _render_variants, data, missing)
+        except (OSError, Image.DecompressionBombError) as e:
+            # UnidentifiedImageError e "image file is truncated" são OSError.
+            raise ValueError("Arquivo não é uma imagem válida.") from e
+        cache_control = (
+            VARIANT_CACHE_CONTROL if is_company_logo_key(s3_key) else PUBLIC_AVATAR_CACHE_CONTROL
+        )
+        await asyncio.gather(
+            *(
+                run_in_threadpool(
+                    FileService.write_object,
+                    keys[name],
+                    body,
+                    VARIANT_CONTENT_TYPE,
+                    cache_control,
+                )
+                for name, body in rendered.items()
+            )
+        )
+        for name in rendered:
+            _exists_cache.set(keys[name], True)
+    return {"s3_key": s3_key, "variants": keys, "created": sorted(missing)}
+
+
+async def generate_variants_on_save(s3_key: str | None) -> None:
+    """Chamado ao salvar avatar/logo, antes de responder: gera as variantes sem falhar a request.
+
+    Sem Pillow/bucket não faz nada (o proxy serve o original); arquivo inválido ou ausente
+    só gera aviso no log.
+    """
+    if not s3_key or not is_variant_source(s3_key):
+        return
+    if not _pillow_available() or not S3_BUCKET_NAME:
+        return
+    try:
+        await generate_variants(s3_key)
+    except (ValueError, LookupError) as e:
+        logger.warning("image variants not generated for %s: %s", s3_key, e)
@@ -1,12 +1,115 @@
 """Public and recruiter job operations."""
 
+import re
 from typing import Any
 
-from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy import (
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database.models import Application, Company, Job, JobTag, Profile, Tag
+from app.database.connection import after_commit
+from app.database.models import Application, Company, Job, JobSkill, JobTag, Profile, Tag
+from app.services.application_service import ApplicationService
+from app.services.file_service import with_logo_url
+from app.services.pagination import (
+    InvalidCursorError,
+    ListPage,
+    count_total,
+    cursor_created_at_id,
+    encode_cursor,
+)
+from app.services.recommendation_cache import recommendation_cache
+from app.skills import job_skills
+
+# Configuração de text search criada na migração 000002 (portuguese + unaccent).
+SEARCH_TS_CONFIG = "ginga_pt"
+
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _ts_config():
+    return literal_column(f"'{SEARCH_TS_CONFIG}'::regconfig")
+
+
+def job_search_document():
+    """tsvector ponderado de api_jobs: título (A) > tags (B) > empresa (C) > descrição (D).
+
+    Correlacionado com `Job`; usado em UPDATE ... SET search_vector (mesma expressão do
+    backfill da migração 000002).
+    """
+    tag_names = (
+        select(func.coalesce(func.string_agg(Tag.name, " "), ""))
+        .select_from(JobTag)
+        .join(Tag, Tag.id == JobTag.tag_id)
+        .where(JobTag.job_id == Job.id)
+        .scalar_subquery()
+    )
+    company_name = select(Company.name).where(Company.id == Job.company_id).scalar_subquery()
+    cfg = _ts_config()
+    parts = (
+        (Job.title, "A"),
+        (tag_names, "B"),
+        (company_name, "C"),
+        (Job.description, "D"),
+    )
+    doc = None
+    for expr, weight in parts:
+        vec = func.setweight(
+            func.to_tsvector(cfg, func.coalesce(expr, "")), literal_column(f"'{weight}'")
+        )
+        doc = vec if doc is None else doc.op("||")(vec)
+    return doc
+
+
+def build_prefix_tsquery(q: str | None) -> str | None:
+    """Texto livre -> tsquery com prefixo em cada termo (busca enquanto digita).
+
+    Só os termos alfanuméricos entram, então operadores de tsquery digitados pelo usuário
+    não quebram a consulta. Retorna None se não sobrar termo.
+    """
+    if not q:
+        return None
+    tokens = _SEARCH_TOKEN_RE.findall(q.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{t}:*" for t in tokens[:16])
+
+
+async def refresh_job_search_vectors(session: AsyncSession, *criteria: Any) -> None:
+    """Recalcula search_vector das vagas que batem com `criteria` (ex.: Job.id == x)."""
+    await session.execute(
+        update(Job)
+        .where(*criteria)
+        # updated_at explícito: reindexar não é edição da vaga (evita o onupdate).
+        .values(search_vector=job_search_document(), updated_at=Job.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def adjust_active_jobs_count(session: AsyncSession, company_id: int, delta: int) -> None:
+    """Incremento atômico de api_companies.active_jobs_count (na transação da request)."""
+    if not delta:
+        return
+    await session.execute(
+        update(Company)
+        .where(Company.id == company_id)
+        .values(
+            active_jobs_count=Company.active_jobs_count + delta,
+            updated_at=Company.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
 class JobService:
@@ -14,29 +117,48 @@ class JobService:
         self.session = session
 
     async def _skills_for_user(self, user_id: str) -> list[str]:
-        result = await self.session.execute(select(Profile).where(Profile.user_id == user_id))
-        profile = result.scalar_one_or_none()
-        if not profile or not profile.skills:
-            return []
-        return [s.strip().lower() for s in profile.skills.split(",") if s.strip()]
+        skills = await self.session.scalar(
+            select(Profile.skill_list).where(Profile.user_id == user_id)
+        )
+        return list(skills or [])
 
     @staticmethod
     def _job_not_owned_by_user(user_id: str):
         return ~exists().where(and_(Company.id == Job.company_id, Company.owner_id == user_id))
 
     @staticmethod
-    def _requirements_match_skills_clause(skills: list[str]):
-        """True se alguma skill do perfil aparece no texto de requirements (case insensitive)."""
-        hay = func.coalesce(Job.requirements, "")
-        conds: list[Any] = []
-        for s in skills:
-            needle = s.strip().lower()
-            if len(needle) < 1:
-                continue
-            conds.append(func.strpos(func.lower(hay), needle) > 0)
-        if not conds:
-            return None
-        return or_(*conds)
+    def _with_viewer_application(stmt, viewer_id: str):
+        """Candidatura do visitante na mesma query (no máximo uma por vaga: uq user/job)."""
+        return stmt.add_columns(Application.id, Application.status).outerjoin(
+            Application,
+            and_(Application.job_id == Job.id, Application.user_id == viewer_id),
+        )
+
+    @staticmethod
+    def _viewer_context(row: Any, viewer_id: str) -> dict[str, Any]:
+        """Bloco `viewer` a partir de uma linha (Job, application_id, application_status)."""
+        job, application_id, application_status = row
+        return {
+            "is_owner": job.company.owner_id == viewer_id,
+            "has_applied": application_id is not None,
+            "application_id": application_id,
+            "application_status": application_status,
+        }
+
+    @staticmethod
+    def _skill_match_score(skills: list[str]):
+        """Quantas skills do perfil a vaga cita (índice api_job_skills); 0 = nenhuma."""
+        return (
+            select(func.count())
+            .where(JobSkill.job_id == Job.id, JobSkill.skill.in_(skills))
+            .correlate(Job)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _skill_match_clause(skills: list[str]):
+        """Vagas com ao menos uma skill do perfil (busca pelo índice (skill, job_id))."""
+        return Job.id.in_(select(JobSkill.job_id).where(JobSkill.skill.in_(skills)))
 
     async def list_public(
         self,
@@ -47,7 +169,12 @@ class JobService:
         sort: str = "recent",
         viewer_id: str | None = None,
         company_id: int | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
+        cursor: str | None = None,
+        include_total: str = "exact",
+        include_logo_url: bool = False,
+    ) -> ListPage:
+        # Cursor inválido vira 400 antes de qualquer SQL (inclusive a contagem).
+        after = cursor_created_at_id(cursor) if cursor else None
         filters: list[Any] = [Job.is_active.is_(True)]
         if company_id is not None:
             filters.append(Job.company_id == company_id)
@@ -62,42 +189,43 @@ class JobService:
                     )
                 )
             )
-        if q:
-            like = f"%{q}%"
-            company_match = exists().where(
-                and_(Company.id == Job.company_id, Company.name.ilike(like))
-            )
-            tag_q = exists().where(
-                and_(
-                    JobTag.job_id == Job.id,
-                    Tag.id == JobTag.tag_id,
-                    Tag.name.ilike(like),
-                )
-            )
-            filters.append(
-                or_(
-                    Job.title.ilike(like),
-                    Job.description.ilike(like),
-                    company_match,
-                    tag_q,
-                )
-            )
+        ts_query = None
+        tsq_text = build_prefix_tsquery(q)
+        if tsq_text:
+            ts_query = func.to_tsquery(_ts_config(), tsq_text)
+            filters.append(Job.search_vector.op("@@")(ts_query))
 
+        skills: list[str] = []
         if sort == "recommended" and viewer_id:
             filters.append(self._job_not_owned_by_user(viewer_id))
             skills = await self._skills_for_user(viewer_id)
-            req_match = self._requirements_match_skills_clause(skills)
-            if req_match is not None:
-                filters.append(req_match)
+            if skills:
+                filters.append(self._skill_match_clause(skills))
 
-        if sort == "oldest":
-            order = Job.created_at.asc()
+        ranked = (sort == "relevance" and ts_query is not None) or bool(skills)
+        ascending = sort == "oldest"
+        if skills:
+            order = [
+                self._skill_match_score(skills).desc(),
+                Job.created_at.desc(),
+                Job.id.desc(),
+            ]
+        elif ranked:
+            order = [
+                func.ts_rank_cd(Job.search_vector, ts_query).desc(),
+                Job.created_at.desc(),
+                Job.id.desc(),
+            ]
+        elif ascending:
+            order = [Job.created_at.asc(), Job.id.asc()]
         else:
-            order = Job.created_at.desc()
+            order = [Job.created_at.desc(), Job.id.desc()]
+        if after is not None and ranked:
+            raise InvalidCursorError("Paginação por cursor não suporta sort=relevance/recommended.")
 
         id_stmt = select(Job.id).where(*filters).distinct()
         subq = id_stmt.subquery()
-        total = await self.session.scalar(select(func.count()).select_from(subq))
+        total = await count_total(self.session, id_stmt, include_total)
 
         stmt = (
             select(Job)
@@ -106,31 +234,56 @@ class JobService:
                 selectinload(Job.tags),
             )
             .where(Job.id.in_(select(subq.c.id)))
-            .order_by(order)
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+            .order_by(*order)
         )
-        result = await self.session.execute(stmt)
-        jobs = result.scalars().unique().all()
-        return [self._job_summary(j) for j in jobs], int(total or 0)
+        if viewer_id:
+            stmt = self._with_viewer_application(stmt, viewer_id)
+        if after is not None:
+            key = tuple_(Job.created_at, Job.id)
+            stmt = stmt.where(key > after if ascending else key < after)
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        result = await self.session.execute(stmt.limit(page_size + 1))
+        rows = result.all()
+        next_cursor = None
+        has_more = len(rows) > page_size
+        if has_more:
+            rows = rows[:page_size]
+            if not ranked:
+                last = rows[-1][0]
+                next_cursor = encode_cursor(last.created_at, last.id)
+        items = []
+        for row in rows:
+            item = self._job_summary(row[0], include_logo_url)
+            if viewer_id:
+                item["viewer"] = self._viewer_context(row, viewer_id)
+            items.append(item)
+        return ListPage(items, total, next_cursor, has_more)
 
-    def _job_summary(self, job: Job) -> dict[str, Any]:
+    def _job_summary(self, job: Job, include_logo_url: bool = False) -> dict[str, Any]:
         return {
             "id": job.id,
             "title": job.title,
             "salary_range": job.salary_range,
             "is_active": job.is_active,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "company": {
-                "id": job.company.id,
-                "name": job.company.name,
-                "logo_s3_key": job.company.logo_s3_key,
-            },
+            "created_at": job.created_at,
+            "company": with_logo_url(
+                {
+                    "id": job.company.id,
+                    "name": job.company.name,
+                    "logo_s3_key": job.company.logo_s3_key,
+                },
+                include_logo_url,
+            ),
             "tags": [t.name for t in job.tags],
         }
 
-    async def get_detail(self, job_id: int, viewer_id: str | None) -> dict[str, Any] | None:
-        result = await self.session.execute(
+    async def get_detail(
+        self, job_id: int, viewer_id: str | None, include_logo_url: bool = False
+    ) -> dict[str, Any] | None:
+        """Detalhe da vaga. Com visitante autenticado, `viewer` diz se ele é dono da empresa
+        e se já se candidatou (id/status da candidatura), sem query extra; anônimo: None."""
+        stmt = (
             select(Job)
             .options(
                 selectinload(Job.company),
@@ -138,20 +291,15 @@ class JobService:
             )
             .where(Job.id == job_id)
         )
-        job = result.scalar_one_or_none()
-        if not job:
+        if viewer_id:
+            stmt = self._with_viewer_application(stmt, viewer_id)
+        row = (await self.session.execute(stmt)).first()
+        if not row:
+            return None
+        job = row[0]
+        viewer = self._viewer_context(row, viewer_id) if viewer_id else None
+        if not job.is_active and not (viewer and viewer["is_owner"]):
             return None
-        if not job.is_active:
-            if not viewer_id:
-                return None
-            own = await self.session.scalar(
-                select(Company.id).where(
-                    Company.id == job.company_id,
-                    Company.owner_id == viewer_id,
-                )
-            )
-            if not own:
-                return None
         return {
             "id": job.id,
             "title": job.title,
@@ -159,18 +307,24 @@ class JobService:
             "requirements": job.requirements,
             "salary_range": job.salary_range,
             "is_active": job.is_active,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "company": {
-                "id": job.company.id,
-                "name": job.company.name,
-                "website": job.company.website,
-                "description": job.company.description,
-                "logo_s3_key": job.company.logo_s3_key,
-            },
+            "created_at": job.created_at,
+            "company": with_logo_url(
+                {
+                    "id": job.company.id,
+                    "name": job.company.name,
+                    "website": job.company.website,
+                    "description": job.company.description,
+                    "logo_s3_key": job.company.logo_s3_key,
+                },
+                include_logo_url,
+            ),
             "tags": [t.name for t in job.tags],
+            "viewer": viewer,
         }
 
-    async def list_recruiter(self, owner_id: str) -> list[dict[str, Any]]:
+    async def list_recruiter(
+        self, owner_id: str, include_logo_url: bool = False
+    ) -> list[dict[str, Any]]:
         result = await self.session.execute(
             select(Job)
             .join(Company)
@@ -179,15 +333,13 @@ class JobService:
             .order_by(Job.created_at.desc())
         )
         jobs = result.scalars().unique().all()
+        counts = await ApplicationService(self.session).counts_by_job([j.id for j in jobs])
         out = []
         for j in jobs:
-            cnt = await self.session.scalar(
-                select(func.count())
-                .select_from(Application)
-                .where(Application.job_id == j.id)
-            )
-            row = self._job_summary(j)
-            row["applications_count"] = int(cnt or 0)
+            by_status = counts[j.id]
+            row = self._job_summary(j, include_logo_url)
+            row["applications_count"] = sum(by_status.values())
+            row["applications_by_status"] = by_status
             out.append(row)
         return out
 
@@ -215,6 +367,11 @@ class JobService:
         await self.session.flush()
         await self._set_tags(job, tag_names)
         await self.session.flush()
+        await refresh_job_search_vectors(self.session, Job.id == job.id)
+        await self._refresh_skill_index(job.id, job.requirements)
+        if job.is_active:
+            await adjust_active_jobs_count(self.session, company_id, 1)
+            after_commit(self.session, recommendation_cache.invalidate_all)
         return {"id": job.id}
 
     async def update(
@@ -229,33 +386,95 @@ class JobService:
             .join(Company)
             .options(selectinload(Job.tags))
             .where(Job.id == job_id, Company.owner_id == owner_id)
+            # Lock da linha até o commit: dois toggles concorrentes de is_active não leem o
+            # mesmo valor antigo (e não aplicam ±1 duas vezes em active_jobs_count).
+            .with_for_update(of=Job)
         )
         job = result.scalar_one_or_none()
         if not job:
             return None
+        was_active = job.is_active
         for k in ("title", "description", "requirements", "salary_range", "is_active"):
             if k in data:
                 setattr(job, k, data[k])
         if tag_names is not None:
             await self._set_tags(job, tag_names)
         await self.session.flush()
+        if tag_names is not None or "title" in data or "description" in data:
+            await refresh_job_search_vectors(self.session, Job.id == job.id)
+        skills_changed = tag_names is not None or "requirements" in data
+        if skills_changed:
+            await self._refresh_skill_index(job.id, job.requirements)
+        if job.is_active != was_active:
+            await adjust_active_jobs_count(self.session, job.company_id, 1 if job.is_active else -1)
+        if job.is_active != was_active or (job.is_active and skills_changed):
+            after_commit(self.session, recommendation_cache.invalidate_all)
         return await self.get_detail(job_id, owner_id)
 
     async def _set_tags(self, job: Job, tag_names: list[str]) -> None:
-        # Evita lazy load em job.tags (MissingGreenlet com AsyncSession).
-        await self.session.refresh(job, attribute_names=["tags"])
-        job.tags.clear()
+        """Substitui as tags da vaga com operações em lote (sem SELECT/flush por tag).
+
+        Nomes são comparados sem diferenciar maiúsculas (como o filtro `tag` de list_public):
+        "python" reaproveita a tag "Python" existente.
+        """
+        wanted: dict[str, str] = {}
         for raw in tag_names:
             name = raw.strip()
-            if not name:
-                continue
-            result = await self.session.execute(select(Tag).where(Tag.name == name))
-            tag = result.scalar_one_or_none()
-            if not tag:
-                tag = Tag(name=name)
-                self.session.add(tag)
-                await self.session.flush()
-            job.tags.append(tag)
+            if name and name.lower() not in wanted:
+                wanted[name.lower()] = name
+        tag_ids = await self._resolve_tag_ids(wanted)
+
+        await self.session.execute(delete(JobTag).where(JobTag.job_id == job.id))
+        if tag_ids:
+            await self.session.execute(
+                insert(JobTag),
+                [{"job_id": job.id, "tag_id": tid} for tid in dict.fromkeys(tag_ids)],
+            )
+        # job.tags foi alterado por fora do ORM: recarrega na próxima leitura.
+        self.session.expire(job, ["tags"])
+
+    async def _refresh_skill_index(self, job_id: int, requirements: str | None) -> None:
+        """Regrava api_job_skills da vaga (termos TECH_LIST dos requisitos + tags)."""
+        tag_names = await self.session.scalars(
+            select(Tag.name).join(JobTag, JobTag.tag_id == Tag.id).where(JobTag.job_id == job_id)
+        )
+        skills = job_skills(requirements, list(tag_names))
+        await self.session.execute(delete(JobSkill).where(JobSkill.job_id == job_id))
+        if skills:
+            await self.session.execute(
+                insert(JobSkill),
+                [{"job_id": job_id, "skill": skill[:100]} for skill in sorted(skills)],
+            )
+
+    async def _resolve_tag_ids(self, wanted: dict[str, str]) -> list[int]:
+        """{nome minúsculo: nome digitado} -> ids em api_tags, criando os que faltam."""
+        if not wanted:
+            return []
+        found: dict[str, int] = {}
+
+        async def _select_existing(lowered: list[str]) -> None:
+            result = await self.session.execute(
+                select(func.lower(Tag.name), func.min(Tag.id))
+                .where(func.lower(Tag.name).in_(lowered))
+                .group_by(func.lower(Tag.name))
+            )
+            found.update({lname: tid for lname, tid in result.all()})
+
+        await _select_existing(list(wanted))
+        missing = [wanted[k] for k in wanted if k not in found]
+        if missing:
+            result = await self.session.execute(
+                pg_insert(Tag)
+                .values([{"name": n} for n in missing])
+                .on_conflict_do_nothing(constraint="uq_api_tags_name")
+                .returning(Tag.id, Tag.name)
+            )
+            found.update({name.lower(): tid for tid, name in result.all()})
+            # Criadas por outra transação entre o SELECT e o INSERT (conflito ignorado).
+            raced = [k for k in wanted if k not in found]
+            if raced:
+                await _select_existing(raced)
+        return [found[k] for k in wanted if k in found]
 
     async def is_owner(self, user_id: str, job_id: int) -> bool:
         result = await self.session.execute(
@@ -265,30 +484,48 @@ class JobService:
         )
         return result.scalar_one_or_none() is not None
 
-    async def recommended_for_user(self, sub: str, limit: int = 3) -> list[dict[str, Any]]:
-        """Skills × requirements; exclui vagas das empresas do próprio usuário."""
+    async def recommended_for_user(
+        self, sub: str, limit: int = 3, include_logo_url: bool = False
+    ) -> list[dict[str, Any]]:
+        """Vagas com mais skills do perfil em comum (api_job_skills), depois as mais recentes.
+
+        Sem skills no perfil ou sem nenhuma vaga compatível, cai para as vagas mais recentes.
+        Exclui vagas das empresas do próprio usuário. Resultado em cache por usuário
+        (ver app.services.recommendation_cache).
+        """
+        generation, jobs = await recommendation_cache.get(sub, limit)
+        if jobs is None:
+            jobs = await self._recommended_for_user(sub, limit)
+            await recommendation_cache.set(sub, limit, generation, jobs)
+        if include_logo_url:
+            # URLs assinadas não entram no cache (vencem e podem ir para o Redis): cópias.
+            jobs = [{**j, "company": with_logo_url(dict(j["company"]), True)} for j in jobs]
+        return jobs
+
+    async def _recommended_for_user(self, sub: str, limit: int) -> list[dict[str, Any]]:
         skills = await self._skills_for_user(sub)
-        not_own = self._job_not_owned_by_user(sub)
-        req_match = self._requirements_match_skills_clause(skills)
-
-        async def _fetch(extra_req: Any | None) -> list[Job]:
-            parts: list[Any] = [Job.is_active.is_(True), not_own]
-            if extra_req is not None:
-                parts.append(extra_req)
-            stmt = (
-                select(Job)
-                .options(selectinload(Job.company), selectinload(Job.tags))
-                .where(*parts)
-                .order_by(Job.created_at.desc())
-                .limit(limit)
-            )
-            result = await self.session.execute(stmt)
-            return list(result.scalars().unique().all())
+        base = (
+            select(Job)
+            .options(selectinload(Job.company), selectinload(Job.tags))
+            .where(Job.is_active.is_(True), self._job_not_owned_by_user(sub))
+            .limit(limit)
+        )
 
-        if req_match is not None:
-            jobs = await _fetch(req_match)
+        if skills:
+            matched = (
+                select(JobSkill.job_id, func.count().label("score"))
+                .where(JobSkill.skill.in_(skills))
+                .group_by(JobSkill.job_id)
+                .subquery()
+            )
+            result = await self.session.execute(
+                base.join(matched, matched.c.job_id == Job.id).order_by(
+                    matched.c.score.desc(), Job.created_at.desc(), Job.id.desc()
+                )
+            )
+            jobs = result.scalars().unique().all()
             if jobs:
                 return [self._job_summary(j) for j in jobs]
 
-        jobs = await _fetch(None)
-        return [self._job_summary(j) for j in jobs]
+        result = await self.session.execute(base.order_by(Job.created_at.desc(), Job.id.desc()))
+        return [self._job_summary(j) for j in result.scalars().unique().all()]
@@ -0,0 +1,119 @@
+"""Paginação das listagens: página (OFFSET) ou cursor opaco (keyset), e contagem total."""
+
+import base64
+import json
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# include_total: exact = count(*) (padrão), estimate = estatísticas do planner (em cache),
+# false = sem total (o cliente usa has_more).
+TOTAL_MODES = ("exact", "estimate", "false")
+ESTIMATE_CACHE_TTL = 60
+
+_estimate_cache = TTLCache(maxsize=1024, ttl=ESTIMATE_CACHE_TTL)
+
+
+class InvalidCursorError(ValueError):
+    """Cursor malformado ou incompatível com a ordenação pedida."""
+
+
+class ListPage(NamedTuple):
+    items: list[dict[str, Any]]
+    total: int | None
+    next_cursor: str | None
+    has_more: bool
+
+
+def encode_cursor(*values: Any) -> str:
+    """Valores da chave de ordenação da última linha -> token opaco (base64url)."""
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple[Any, ...]:
+    """Inverso de encode_cursor; cada valor passa pelo parser da posição correspondente."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor com formato inesperado")
+        return tuple(parse(v) for parse, v in zip(parsers, values, strict=True))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Cursor inválido.") from e
+
+
+def cursor_created_at_id(cursor: str) -> tuple[datetime, int]:
+    """Cursor das listagens ordenadas por (created_at, id)."""
+    created_at, row_id = decode_cursor(cursor, datetime.fromisoformat, int)
+    return created_at, row_id
+
+
+async def count_total(session: AsyncSession, id_stmt: Select, mode: str = "exact") -> int | None:
+    """Total de linhas de `id_stmt` conforme include_total (ver TOTAL_MODES)."""
+    if mode == "false":
+        return None
+    if mode == "estimate":
+        return await _estimated_count(session, id_stmt)
+    total = await session.scalar(select(func.count()).select_from(id_stmt.subquery()))
+    return int(total or 0)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) de um SELECT, com os parâmetros ligados como no statement original."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _frozen(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+async def _estimated_count(session: AsyncSession, id_stmt: Select) -> int:
+    """Linhas estimadas pelo planner (EXPLAIN, sem executar), em cache por assinatura do filtro.
+
+    A assinatura é o SQL compilado mais os valores dos parâmetros, então filtros iguais (mesma
+    busca, tag, status...) reaproveitam a estimativa durante ESTIMATE_CACHE_TTL segundos.
+    """
+    conn = await session.connection()
+    compiled = id_stmt.compile(dialect=conn.dialect)
+    key = (compiled.string, tuple(sorted((k, _frozen(v)) for k, v in compiled.params.items())))
+    cached = _estimate_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        # Savepoint: se o EXPLAIN falhar, a transação da request continua utilizável.
+        async with session.begin_nested():
+            plan = (await conn.execute(_Explain(id_stmt))).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = max(int(plan[0]["Plan"]["Plan Rows"]), 0)
+    except (DBAPIError, KeyError, IndexError, TypeError, ValueError) as e:
+        logger.warning("count estimate failed, using exact count: %s", e)
+        estimate = await count_total(session, id_stmt, "exact") or 0
+    _estimate_cache.set(key, estimate)
+    return estimate
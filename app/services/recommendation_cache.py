@@ -0,0 +1,102 @@
+"""Cache por usuário de JobService.recommended_for_user.
+
+Invalidação:
+- por usuário: quando o perfil muda `skills` (UserService.update_me);
+- global: um contador de geração incrementado quando uma vaga é criada, ativada, desativada
+  ou muda requisitos/tags enquanto ativa (JobService). Entradas de gerações anteriores
+  são ignoradas na leitura e expiram pelo TTL.
+
+As duas rodam depois do commit da request (`after_commit`): invalidando antes, uma request
+concorrente poderia recalcular a partir do estado ainda não commitado e gravar o resultado
+antigo na geração nova.
+
+Com o backend em memória (padrão) a geração é por processo: outras instâncias enxergam
+mudanças de vagas em até RECOMMENDATION_CACHE_TTL segundos. Com REDIS_URL, todas
+compartilham cache e geração.
+"""
+
+from typing import Any
+
+from app.cache import make_cache_backend
+from app.config import (
+    RECOMMENDATION_CACHE_SIZE,
+    RECOMMENDATION_CACHE_TTL,
+    REDIS_URL,
+)
+from app.metrics import counter_value, registry
+
+_GENERATION_KEY = "rec:gen"
+
+
+def _user_key(user_id: str) -> str:
+    return f"rec:u:{user_id}"
+
+
+class RecommendationCache:
+    def __init__(self, backend: Any, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, user_id: str, limit: int) -> tuple[int, list[dict[str, Any]] | None]:
+        """(geração atual, recomendações em cache ou None). Passe a geração para `set`."""
+        if self.ttl <= 0:
+            return 0, None
+        generation, entry = await self.backend.get_many([_GENERATION_KEY, _user_key(user_id)])
+        generation = int(generation or 0)
+        if (
+            isinstance(entry, dict)
+            and entry.get("gen") == generation
+            and entry.get("limit") == limit
+        ):
+            self.hits += 1
+            return generation, entry["jobs"]
+        self.misses += 1
+        return generation, None
+
+    async def set(
+        self, user_id: str, limit: int, generation: int, jobs: list[dict[str, Any]]
+    ) -> None:
+        """Grava com a geração lida *antes* da consulta: se uma vaga mudou no meio, a entrada
+        já nasce obsoleta em vez de esconder a mudança até o TTL."""
+        if self.ttl <= 0:
+            return
+        entry = {"gen": generation, "limit": limit, "jobs": jobs}
+        await self.backend.set(_user_key(user_id), entry, self.ttl)
+
+    async def invalidate_user(self, user_id: str) -> None:
+        await self.backend.delete(_user_key(user_id))
+
+    async def invalidate_all(self) -> None:
+        await self.backend.incr(_GENERATION_KEY)
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+recommendation_cache = RecommendationCache(
+    make_cache_backend(REDIS_URL, RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL),
+    ttl=RECOMMENDATION_CACHE_TTL,
+)
+
+
+@registry.register_collector
+def _recommendation_cache_metrics():
+    return [
+        counter_value(
+            "ginga_recommendation_cache_hits",
+            "Recomendações servidas do cache.",
+            recommendation_cache.hits,
+        ),
+        counter_value(
+            "ginga_recommendation_cache_misses",
+            "Recomendações calculadas no banco.",
+            recommendation_cache.misses,
+        ),
+    ]
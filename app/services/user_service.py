@@ -3,13 +3,16 @@
 import re
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import JSON, case, func, literal_column, or_, select, type_coerce
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.auth.jwt import normalize_cognito_sub
+from app.cache import TTLCache
+from app.database.connection import after_commit
 from app.database.models import (
     Education,
     ProfessionalExperience,
@@ -17,6 +20,9 @@ from app.database.models import (
     TechProject,
     User,
 )
+from app.services.image_variants import generate_variants_on_save
+from app.services.recommendation_cache import recommendation_cache
+from app.skills import parse_skills
 
 
 class ProfileSlugTakenError(Exception):
@@ -29,6 +35,11 @@ class InvalidProfileSlugError(Exception):
 
 MAX_PUBLIC_SLUG_LEN = 200
 
+# sub -> (email, first_name, last_name) já gravados em api_users por este processo.
+USER_SYNC_CACHE_TTL = 300
+_synced_users = TTLCache(maxsize=4096, ttl=USER_SYNC_CACHE_TTL)
+
+
 def _slugify(value: str) -> str:
     s = value.lower().strip()
     s = re.sub(r"[^a-z0-9]+", "-", s)
@@ -64,14 +75,86 @@ def _public_slug_from_handle(raw: str) -> str:
     return slug
 
 
-def _is_profile_complete(user: User, profile: Profile | None) -> bool:
+def _is_profile_complete(
+    first_name: str | None,
+    last_name: str | None,
+    profile_slug: str | None,
+    username: str | None,
+) -> bool:
     """Nome, sobrenome e slug público (username espelha o slug) obrigatórios."""
-    slug_ok = bool((profile and (profile.slug or "").strip()) or (user.username or "").strip())
-    return bool(
-        (user.first_name or "").strip()
-        and (user.last_name or "").strip()
-        and slug_ok
+    slug_ok = bool((profile_slug or "").strip() or (username or "").strip())
+    return bool((first_name or "").strip() and (last_name or "").strip() and slug_ok)
+
+
+def _json_object(**fields: Any):
+    """json_build_object('campo', expr, ...) com as chaves como literais SQL."""
+    args: list[Any] = []
+    for name, expr in fields.items():
+        args.extend((literal_column(f"'{name}'"), expr))
+    return func.json_build_object(*args)
+
+
+def _json_children(model: Any, **fields: Any):
+    """Array JSON (ordenado por id) das linhas filhas do perfil; '[]' quando não há."""
+    agg = func.json_agg(aggregate_order_by(_json_object(**fields), model.id))
+    return (
+        select(func.coalesce(agg, literal_column("'[]'::json")))
+        .where(model.profile_user_id == Profile.user_id)
+        .scalar_subquery()
+    )
+
+
+def _me_query():
+    """SELECT de GET /me: colunas do usuário + perfil completo como um objeto JSON."""
+    exp, ed, tp = ProfessionalExperience, Education, TechProject
+    profile = _json_object(
+        bio=Profile.bio,
+        avatar_s3_key=Profile.avatar_s3_key,
+        city=Profile.city,
+        contact_info=Profile.contact_info,
+        skills=Profile.skills,
+        github_url=Profile.github_url,
+        linkedin_url=Profile.linkedin_url,
+        is_portfolio_public=Profile.is_portfolio_public,
+        is_published=Profile.is_published,
+        slug=Profile.slug,
+        experiences=_json_children(
+            exp,
+            id=exp.id,
+            company=exp.company,
+            role=exp.role,
+            start_date=exp.start_date,
+            end_date=exp.end_date,
+            description=exp.description,
+        ),
+        education=_json_children(
+            ed,
+            id=ed.id,
+            institution=ed.institution,
+            course=ed.course,
+            status=ed.status,
+            start_date=ed.start_date,
+            end_date=ed.end_date,
+        ),
+        tech_projects=_json_children(
+            tp,
+            id=tp.id,
+            name=tp.name,
+            description=tp.description,
+            url=tp.url,
+            project_type=tp.project_type,
+        ),
     )
+    return select(
+        User.id,
+        User.email,
+        User.first_name,
+        User.last_name,
+        User.username,
+        User.is_active,
+        User.legacy_user_id,
+        type_coerce(case((Profile.user_id.is_(None), None), else_=profile), JSON).label("profile"),
+    ).outerjoin(Profile, Profile.user_id == User.id)
 
 
 class UserService:
@@ -84,108 +167,95 @@ class UserService:
         email: str,
         first_name: str = "",
         last_name: str = "",
-    ) -> User:
+    ) -> None:
         """Garante linha em api_users (id = sub Cognito). Não grava cognito:username:
-        o @handle da plataforma é só definido em PATCH /api/v1/me (perfil interno)."""
-        sub = normalize_cognito_sub(sub)
-        result = await self.session.execute(select(User).where(User.id == sub))
-        user = result.scalar_one_or_none()
-        if user:
-            user.email = email or user.email
-            user.first_name = first_name or user.first_name
-            user.last_name = last_name or user.last_name
-            await self.session.flush()
-            return user
+        o @handle da plataforma é só definido em PATCH /api/v1/me (perfil interno).
 
-        user = User(
+        Um único INSERT ... ON CONFLICT DO UPDATE, que só escreve quando algum claim mudou
+        (sem UPDATE/updated_at a cada request). Claims já sincronizados ficam em cache por
+        processo (gravados após o commit da request) e nem chegam ao banco; claim vazio
+        não conta na comparação, porque também não é gravado."""
+        sub = normalize_cognito_sub(sub)
+        claims = (email, first_name, last_name)
+        synced = claims
+        cached = _synced_users.get(sub)
+        if cached is not None:
+            if all(not v or v == c for v, c in zip(claims, cached, strict=True)):
+                return
+            synced = tuple(v or c for v, c in zip(claims, cached, strict=True))
+
+        table = User.__table__
+        stmt = pg_insert(table).values(
             id=sub,
             email=email or f"{sub}@users.invalid",
             first_name=first_name,
             last_name=last_name,
             username=None,
         )
-        self.session.add(user)
-        await self.session.flush()
+        # Claim vazio não sobrescreve o valor salvo (mesma regra de antes: `x or user.x`).
+        changed = [c for c, v in zip(("email", "first_name", "last_name"), claims) if v]
+        if changed:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={
+                    **{c: stmt.excluded[c] for c in changed},
+                    "updated_at": func.now(),
+                },
+                where=or_(*(table.c[c].is_distinct_from(stmt.excluded[c]) for c in changed)),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.id])
+        # xmax = 0 só na linha recém-inserida; nenhuma linha = já estava sincronizado.
+        result = await self.session.execute(
+            stmt.returning(literal_column("xmax = 0").label("inserted"))
+        )
+        inserted = result.scalar_one_or_none()
+        if not inserted:
+            # Só depois do commit: num rollback o UPDATE se perde e o cache esconderia isso.
+            after_commit(self.session, lambda: _synced_users.set(sub, synced))
+            return
 
+        user = await self.session.get(User, sub)
         await self._create_profile_with_auto_slug(user)
-        return user
 
     async def get_me(self, sub: str) -> dict[str, Any] | None:
+        """Usuário + perfil + experiências/formação/projetos numa única query (JSON montado
+        no Postgres), sem hidratar objetos ORM."""
         sub = normalize_cognito_sub(sub)
-        result = await self.session.execute(
-            select(User)
-            .options(
-                selectinload(User.profile).selectinload(Profile.experiences),
-                selectinload(User.profile).selectinload(Profile.education_rows),
-                selectinload(User.profile).selectinload(Profile.tech_projects),
-            )
-            .where(User.id == sub)
-        )
-        user = result.scalar_one_or_none()
-        if not user:
+        result = await self.session.execute(_me_query().where(User.id == sub))
+        row = result.one_or_none()
+        if row is None:
             return None
-        return self._serialize_user(user)
-
-    def _serialize_user(self, user: User) -> dict[str, Any]:
-        p = user.profile
-        public_id = (p.slug if p else None) or user.username
+        p = row.profile
+        public_id = (p["slug"] if p else None) or row.username
         return {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
+            "id": row.id,
+            "email": row.email,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
             "username": public_id,
-            "is_profile_complete": _is_profile_complete(user, p),
-            "is_active": user.is_active,
-            "legacy_user_id": user.legacy_user_id,
-            "profile": None
-            if not p
-            else {
-                "bio": p.bio,
-                "avatar_s3_key": p.avatar_s3_key,
-                "city": p.city,
-                "contact_info": p.contact_info,
-                "skills": p.skills,
-                "github_url": p.github_url,
-                "linkedin_url": p.linkedin_url,
-                "is_portfolio_public": p.is_portfolio_public,
-                "is_published": p.is_published,
-                "slug": p.slug,
-                "experiences": [
-                    {
-                        "id": e.id,
-                        "company": e.company,
-                        "role": e.role,
-                        "start_date": e.start_date.isoformat(),
-                        "end_date": e.end_date.isoformat() if e.end_date else None,
-                        "description": e.description,
-                    }
-                    for e in (p.experiences or [])
-                ],
-                "education": [
-                    {
-                        "id": ed.id,
-                        "institution": ed.institution,
-                        "course": ed.course,
-                        "status": ed.status,
-                        "start_date": ed.start_date.isoformat() if ed.start_date else None,
-                        "end_date": ed.end_date.isoformat() if ed.end_date else None,
-                    }
-                    for ed in (p.education_rows or [])
-                ],
-                "tech_projects": [
-                    {
-                        "id": tp.id,
-                        "name": tp.name,
-                        "description": tp.description,
-                        "url": tp.url,
-                        "project_type": tp.project_type,
-                    }
-                    for tp in (p.tech_projects or [])
-                ],
-            },
+            "is_profile_complete": _is_profile_complete(
+                row.first_name, row.last_name, p["slug"] if p else None, row.username
+            ),
+            "is_active": row.is_active,
+            "legacy_user_id": row.legacy_user_id,
+            "profile": p,
         }
 
+    async def is_public_avatar(self, s3_key: str) -> bool:
+        """Avatar atual de um perfil publicado (chave ginga/avatar/<user_id>/...)."""
+        parts = s3_key.split("/")
+        if len(parts) < 4 or parts[0] != "ginga" or parts[1] != "avatar":
+            return False
+        found = await self.session.scalar(
+            select(Profile.user_id).where(
+                Profile.user_id == parts[2],
+                Profile.avatar_s3_key == s3_key,
+                Profile.is_published.is_(True),
+            )
+        )
+        return found is not None
+
     async def _get_profile_by_user_id(self, uid: str) -> Profile | None:
         uid = normalize_cognito_sub(uid)
         r = await self.session.execute(select(Profile).where(Profile.user_id == uid))
@@ -289,6 +359,9 @@ class UserService:
             user.first_name = data["first_name"] or ""
         if "last_name" in data:
             user.last_name = data["last_name"] or ""
+        if "first_name" in data or "last_name" in data:
+            # Linha divergiu dos claims: o próximo ensure_user volta a sincronizar.
+            _synced_users.pop(sub)
 
         profile_data = data.get("profile")
         wants_username = "username" in data
@@ -334,7 +407,12 @@ class UserService:
                     p.slug = new_slug
                     user.username = new_slug
 
+        skills_changed = False
+        new_avatar = None
         if profile_data:
+            skills_changed = "skills" in profile_data and profile_data["skills"] != p.skills
+            if profile_data.get("avatar_s3_key") != p.avatar_s3_key:
+                new_avatar = profile_data.get("avatar_s3_key")
             for key in (
                 "bio",
                 "city",
@@ -348,11 +426,17 @@ class UserService:
             ):
                 if key in profile_data:
                     setattr(p, key, profile_data[key])
+            if "skills" in profile_data:
+                p.skill_list = [s[:100] for s in parse_skills(p.skills)]
 
         if p is not None:
             await self._align_user_username_to_profile_slug(user, p, sub)
 
         await self.session.flush()
+        if skills_changed:
+            after_commit(self.session, lambda: recommendation_cache.invalidate_user(sub))
+        if new_avatar:
+            await generate_variants_on_save(new_avatar)
         return await self.get_me(sub)
 
     async def add_experience(self, sub: str, payload: dict[str, Any]) -> dict[str, Any] | None:
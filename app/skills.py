@@ -0,0 +1,44 @@
+"""Skill normalization and TECH_LIST term extraction (job skill index, recommendations)."""
+
+import re
+
+from app.tech_list import TECH_LIST
+
+
+def normalize_skill(raw: str) -> str:
+    """Forma canônica de comparação: minúsculas, espaços colapsados."""
+    return " ".join((raw or "").lower().split())
+
+
+def parse_skills(raw: str | None) -> list[str]:
+    """Texto separado por vírgulas (Profile.skills) -> skills normalizadas, sem repetição."""
+    out: dict[str, None] = {}
+    for part in (raw or "").split(","):
+        skill = normalize_skill(part)
+        if skill:
+            out[skill] = None
+    return list(out)
+
+
+# Termos mais longos primeiro: "javascript" antes de "java", "react native" antes de "react".
+# Bordas por \w (Unicode): "Go" não casa dentro de "algo", nem "SQL" dentro de "PostgreSQL".
+_TECH_RE = re.compile(
+    "|".join(
+        rf"(?<!\w){re.escape(normalize_skill(t))}(?!\w)"
+        for t in sorted(TECH_LIST, key=len, reverse=True)
+    )
+)
+
+
+def extract_known_skills(text: str | None) -> set[str]:
+    """Termos do vocabulário TECH_LIST (normalizados) citados em `text`."""
+    if not text:
+        return set()
+    return {m.group(0) for m in _TECH_RE.finditer(normalize_skill(text))}
+
+
+def job_skills(requirements: str | None, tag_names: list[str]) -> set[str]:
+    """Skills indexadas de uma vaga: termos TECH_LIST nos requisitos + todas as tags."""
+    skills = extract_known_skills(requirements)
+    skills.update(s for s in (normalize_skill(t) for t in tag_names) if s)
+    return skills
@@ -4,14 +4,20 @@ import { CompanyLogoPlaceholder } from "./CompanyLogoPlaceholder";
 
 type Props = {
   s3Key?: string | null;
+  /** URL já assinada vinda da listagem (`include_logo_url=true`): evita uma chamada por logo. */
+  logoUrl?: string | null;
   className?: string;
   alt?: string;
 };
 
-export function CompanyLogoImage({ s3Key, className = "w-12 h-12", alt = "" }: Props) {
-  const [url, setUrl] = useState<string | null>(null);
+export function CompanyLogoImage({ s3Key, logoUrl, className = "w-12 h-12", alt = "" }: Props) {
+  const [url, setUrl] = useState<string | null>(logoUrl ?? null);
 
   useEffect(() => {
+    if (logoUrl) {
+      setUrl(logoUrl);
+      return;
+    }
     const key = s3Key?.trim();
     if (!key) {
       setUrl(null);
@@ -29,7 +35,7 @@ export function CompanyLogoImage({ s3Key, className = "w-12 h-12", alt = "" }: P
     return () => {
       cancelled = true;
     };
-  }, [s3Key]);
+  }, [s3Key, logoUrl]);
 
   if (url) {
     return (
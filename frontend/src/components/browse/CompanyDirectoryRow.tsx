@@ -6,6 +6,7 @@ export type PublicCompanySummary = {
   name: string;
   website?: string | null;
   logo_s3_key?: string | null;
+  logo_url?: string | null;
   active_jobs_count: number;
 };
 
@@ -38,7 +39,12 @@ export function CompanyDirectoryRow({ company }: { company: PublicCompanySummary
     >
       <div className="flex items-start justify-between gap-4">
         <div className="flex items-start space-x-4 flex-1 min-w-0">
-          <CompanyLogoImage s3Key={company.logo_s3_key} className="w-14 h-14" alt={company.name} />
+          <CompanyLogoImage
+            s3Key={company.logo_s3_key}
+            logoUrl={company.logo_url}
+            className="w-14 h-14"
+            alt={company.name}
+          />
           <div className="flex-1 min-w-0">
             <h3 className="font-bold text-foreground text-lg">{company.name}</h3>
             {href ? (
@@ -1,11 +1,12 @@
 import { Link } from "react-router-dom";
-import { CompanyLogoPlaceholder } from "../CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../CompanyLogoImage";
 
 export type CompanyHeroData = {
   name: string;
   description: string;
   website: string;
   logo_s3_key?: string | null;
+  logo_url?: string | null;
   active_jobs_count: number;
 };
 
@@ -36,7 +37,12 @@ export function CompanyHeroHeader({ company }: { company: CompanyHeroData }) {
 
       <div className="bg-surface rounded-xl shadow-[var(--shadow-soft)] border border-gray-100 p-8">
         <div className="flex flex-col sm:flex-row sm:items-start gap-6">
-          <CompanyLogoPlaceholder className="w-20 h-20 shrink-0" />
+          <CompanyLogoImage
+            s3Key={company.logo_s3_key}
+            logoUrl={company.logo_url}
+            className="w-20 h-20"
+            alt={company.name}
+          />
           <div className="min-w-0 flex-1">
             <h1 className="text-3xl font-bold text-foreground">{company.name}</h1>
             <p className="text-primary font-medium mt-2">{jobsLabel}</p>
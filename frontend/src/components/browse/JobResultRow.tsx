@@ -1,13 +1,13 @@
 import { Link } from "react-router-dom";
 import { formatTimeAgo } from "../../lib/time";
-import { CompanyLogoPlaceholder } from "../CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../CompanyLogoImage";
 
 export type JobSummary = {
   id: number;
   title: string;
   salary_range?: string | null;
   created_at?: string | null;
-  company: { id: number; name: string };
+  company: { id: number; name: string; logo_s3_key?: string | null; logo_url?: string | null };
   tags: string[];
 };
 
@@ -17,7 +17,12 @@ export function JobResultRow({ job }: { job: JobSummary }) {
       <div className="bg-surface rounded-xl shadow-[var(--shadow-soft)] p-6 border border-gray-100 hover:shadow-md hover:border-primary/30 transition-all">
         <div className="flex items-start justify-between gap-4">
           <div className="flex items-start space-x-4 flex-1 min-w-0">
-            <CompanyLogoPlaceholder className="w-14 h-14" />
+            <CompanyLogoImage
+              s3Key={job.company.logo_s3_key}
+              logoUrl={job.company.logo_url}
+              className="w-14 h-14"
+              alt={job.company.name}
+            />
             <div className="flex-1 min-w-0">
               <h3 className="font-bold text-foreground text-lg hover:text-primary transition-colors">{job.title}</h3>
               <p className="text-gray-600">{job.company.name}</p>
@@ -53,6 +53,7 @@ export function PublicJobListSection({
       if (companyId != null) params.set("company_id", String(companyId));
       params.set("page", String(page));
       params.set("page_size", "12");
+      params.set("include_logo_url", "true");
       const qs = params.toString();
       const [listRes, tagRes] = await Promise.all([
         apiFetch<ListResponse>(`/api/v1/jobs?${qs}`),
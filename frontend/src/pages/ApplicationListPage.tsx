@@ -2,7 +2,7 @@ import { useCallback, useEffect, useMemo, useState } from "react";
 import { Link, useSearchParams } from "react-router-dom";
 import { apiFetch } from "../lib/api";
 import { formatTimeAgo } from "../lib/time";
-import { CompanyLogoPlaceholder } from "../components/CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../components/CompanyLogoImage";
 import { applicationStatusClasses, applicationStatusLabel } from "../lib/jobStatus";
 
 type ApplicationRow = {
@@ -14,7 +14,7 @@ type ApplicationRow = {
     id: number;
     title: string;
     is_active: boolean;
-    company: { id: number; name: string };
+    company: { id: number; name: string; logo_s3_key?: string | null; logo_url?: string | null };
   };
 };
 
@@ -44,6 +44,7 @@ export function ApplicationListPage() {
       params.set("page", String(page));
       params.set("page_size", "20");
       if (statusFilter) params.set("status", statusFilter);
+      params.set("include_logo_url", "true");
       const res = await apiFetch<ListResponse>(`/api/v1/applications?${params.toString()}`);
       setData(res);
     } catch (e) {
@@ -185,7 +186,12 @@ export function ApplicationListPage() {
                   <div className="p-5">
                     <div className="flex items-start justify-between gap-4">
                       <div className="flex items-start space-x-4 flex-1 min-w-0">
-                        <CompanyLogoPlaceholder className="w-14 h-14" />
+                        <CompanyLogoImage
+                          s3Key={application.job.company.logo_s3_key}
+                          logoUrl={application.job.company.logo_url}
+                          className="w-14 h-14"
+                          alt={application.job.company.name}
+                        />
                         <div className="flex-1 min-w-0">
                           <Link
                             to={`/jobs/${application.job.id}`}
@@ -22,7 +22,7 @@ export function CompanyPublicDetailPage() {
     let cancelled = false;
     (async () => {
       try {
-        const res = await apiFetch<CompanyHeroData>(`/api/v1/companies/public/${id}`);
+        const res = await apiFetch<CompanyHeroData>(`/api/v1/companies/public/${id}?include_logo_url=true`);
         if (!cancelled) {
           setData(res);
           setErr(null);
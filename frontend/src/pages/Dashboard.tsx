@@ -3,7 +3,7 @@ import { Link } from "react-router-dom";
 import { apiFetch } from "../lib/api";
 import { fetchPrivateImageUrl } from "../lib/imageUpload";
 import { formatTimeAgo } from "../lib/time";
-import { CompanyLogoPlaceholder } from "../components/CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../components/CompanyLogoImage";
 import { applicationStatusClasses, applicationStatusLabel } from "../lib/jobStatus";
 
 type MeProfile = {
@@ -29,7 +29,7 @@ type JobSummary = {
   title: string;
   salary_range?: string | null;
   created_at?: string | null;
-  company: { id: number; name: string; logo_s3_key?: string | null };
+  company: { id: number; name: string; logo_s3_key?: string | null; logo_url?: string | null };
   tags: string[];
 };
 
@@ -40,7 +40,7 @@ type ApplicationRow = {
   job: {
     id: number;
     title: string;
-    company: { id: number; name: string; logo_s3_key?: string | null };
+    company: { id: number; name: string; logo_s3_key?: string | null; logo_url?: string | null };
   };
 };
 
@@ -84,9 +84,9 @@ export function Dashboard() {
       try {
         const [m, rec, apps] = await Promise.all([
           apiFetch<Me>("/api/v1/me"),
-          apiFetch<{ jobs: JobSummary[] }>("/api/v1/dashboard/recommended-jobs"),
+          apiFetch<{ jobs: JobSummary[] }>("/api/v1/dashboard/recommended-jobs?include_logo_url=true"),
           apiFetch<{ results: ApplicationRow[]; total: number }>(
-            "/api/v1/applications?page=1&page_size=4",
+            "/api/v1/applications?page=1&page_size=4&include_logo_url=true",
           ),
         ]);
         if (!cancelled) {
@@ -235,7 +235,12 @@ export function Dashboard() {
                     >
                       <div className="flex items-start justify-between">
                         <div className="flex items-start space-x-4">
-                          <CompanyLogoPlaceholder className="w-12 h-12" />
+                          <CompanyLogoImage
+                            s3Key={job.company.logo_s3_key}
+                            logoUrl={job.company.logo_url}
+                            className="w-12 h-12"
+                            alt={job.company.name}
+                          />
                           <div>
                             <h3 className="font-semibold text-foreground hover:text-primary transition-colors">
                               {job.title}
@@ -350,7 +355,12 @@ export function Dashboard() {
                     >
                       <div className="flex items-start justify-between gap-2">
                         <div className="flex items-start space-x-3 flex-1 min-w-0">
-                          <CompanyLogoPlaceholder className="w-10 h-10 rounded-lg" />
+                          <CompanyLogoImage
+                            s3Key={application.job.company.logo_s3_key}
+                            logoUrl={application.job.company.logo_url}
+                            className="w-10 h-10"
+                            alt={application.job.company.name}
+                          />
                           <div className="flex-1 min-w-0">
                             <h3 className="font-semibold text-foreground text-sm truncate">
                               {application.job.title}
@@ -3,7 +3,7 @@ import { Link, useParams } from "react-router-dom";
 import { apiFetch } from "../lib/api";
 import { useAuth } from "../contexts/AuthContext";
 import { formatTimeAgo } from "../lib/time";
-import { CompanyLogoPlaceholder } from "../components/CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../components/CompanyLogoImage";
 
 type JobDetail = {
   id: number;
@@ -18,8 +18,16 @@ type JobDetail = {
     name: string;
     website?: string | null;
     description?: string | null;
+    logo_s3_key?: string | null;
+    logo_url?: string | null;
   };
   tags: string[];
+  viewer?: {
+    is_owner: boolean;
+    has_applied: boolean;
+    application_id: number | null;
+    application_status: string | null;
+  } | null;
 };
 
 export function JobDetailPage() {
@@ -45,24 +53,15 @@ export function JobDetailPage() {
     setLoading(true);
     setErr(null);
     try {
-      const j = await apiFetch<JobDetail>(`/api/v1/jobs/${id}`);
+      const j = await apiFetch<JobDetail>(`/api/v1/jobs/${id}?include_logo_url=true`);
       setJob(j);
-
-      if (user) {
-        const [companiesRes, appsRes] = await Promise.all([
-          apiFetch<{ companies: { id: number }[] }>("/api/v1/companies/mine"),
-          apiFetch<{ results: { id: number; job: { id: number }; status: string }[] }>(
-            "/api/v1/applications?page_size=100",
-          ),
-        ]);
-        const owns = companiesRes.companies?.some((c) => c.id === j.company.id) ?? false;
-        setIsOwner(owns);
-        const mine = appsRes.results?.find((a) => a.job.id === j.id);
-        setMyApplication(mine ? { id: mine.id, status: mine.status } : null);
-      } else {
-        setIsOwner(false);
-        setMyApplication(null);
-      }
+      const viewer = user ? j.viewer : null;
+      setIsOwner(viewer?.is_owner ?? false);
+      setMyApplication(
+        viewer?.application_id != null
+          ? { id: viewer.application_id, status: viewer.application_status ?? "applied" }
+          : null,
+      );
     } catch (e) {
       setErr(e instanceof Error ? e.message : "Vaga não encontrada");
       setJob(null);
@@ -138,7 +137,12 @@ export function JobDetailPage() {
           <div className="lg:col-span-2 space-y-6">
             <div className="bg-surface rounded-xl shadow-[var(--shadow-soft)] p-6 border border-gray-100">
               <div className="flex items-start space-x-4">
-                <CompanyLogoPlaceholder className="w-16 h-16" />
+                <CompanyLogoImage
+                  s3Key={job.company.logo_s3_key}
+                  logoUrl={job.company.logo_url}
+                  className="w-16 h-16"
+                  alt={job.company.name}
+                />
                 <div className="flex-1">
                   <div className="flex items-start justify-between gap-2">
                     <div>
@@ -32,6 +32,7 @@ export function PublicCompaniesPage() {
       if (q.trim()) params.set("q", q.trim());
       params.set("page", String(page));
       params.set("page_size", "12");
+      params.set("include_logo_url", "true");
       const res = await apiFetch<ListResponse>(`/api/v1/companies/public?${params.toString()}`);
       setData(res);
     } catch (e) {
@@ -2,7 +2,7 @@ import { useEffect, useMemo, useState } from "react";
 import { Link } from "react-router-dom";
 import { apiFetch } from "../lib/api";
 import { formatDateBR } from "../lib/time";
-import { CompanyLogoPlaceholder } from "../components/CompanyLogoPlaceholder";
+import { CompanyLogoImage } from "../components/CompanyLogoImage";
 
 type RecruiterJobRow = {
   id: number;
@@ -10,7 +10,7 @@ type RecruiterJobRow = {
   salary_range?: string | null;
   is_active: boolean;
   created_at?: string | null;
-  company: { id: number; name: string; logo_s3_key?: string | null };
+  company: { id: number; name: string; logo_s3_key?: string | null; logo_url?: string | null };
   tags: string[];
   applications_count: number;
 };
@@ -24,7 +24,7 @@ export function RecruiterJobsDashboardPage() {
     let cancelled = false;
     (async () => {
       try {
-        const res = await apiFetch<{ jobs: RecruiterJobRow[] }>("/api/v1/recruiter/jobs");
+        const res = await apiFetch<{ jobs: RecruiterJobRow[] }>("/api/v1/recruiter/jobs?include_logo_url=true");
         if (!cancelled) {
           setJobs(res.jobs ?? []);
           setErr(null);
@@ -220,7 +220,14 @@ export function RecruiterJobsDashboardPage() {
                       </td>
                       <td className="py-4 px-6">
                         <div className="flex items-center">
-                          <CompanyLogoPlaceholder className="w-8 h-8 mr-3" />
+                          <div className="mr-3">
+                            <CompanyLogoImage
+                              s3Key={job.company.logo_s3_key}
+                              logoUrl={job.company.logo_url}
+                              className="w-8 h-8"
+                              alt={job.company.name}
+                            />
+                          </div>
                           <span className="text-sm text-foreground">{job.company.name}</span>
                         </div>
                       </td>
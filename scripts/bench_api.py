@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark HTTP in-process dos endpoints quentes (httpx + ASGITransport, sem rede).
+
+Autentica pelo DEV_AUTH_BYPASS (Bearer = DEV_AUTH_BYPASS_SECRET, usuário DEV_USER_SUB),
+então roda só com ENVIRONMENT=development. Para cada cenário reporta p50/p95/p99, req/s e
+queries SQL por request. Use um banco com massa (scripts/seed_perf_data.py) e compare
+rodadas antes/depois de uma mudança com os mesmos parâmetros.
+
+Run from repo root: uv run python scripts/bench_api.py [-n 300] [-c 10] [--only jobs]
+"""
+
+import argparse
+import asyncio
+import contextvars
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Antes de importar app.config: o bypass só vale em development.
+os.environ.setdefault("ENVIRONMENT", "development")
+os.environ["DEV_AUTH_BYPASS"] = "true"
+os.environ.setdefault("DEV_AUTH_BYPASS_SECRET", "bench-local-secret")
+
+import httpx
+from app.config import DEV_AUTH_BYPASS_SECRET, IS_DEVELOPMENT
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import Job
+from app.main import app
+from sqlalchemy import event, select
+
+# Contador da request corrente: o contexto é herdado pela app ASGI (mesmo event loop).
+_queries: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "bench_queries", default=None
+)
+
+
+def _count_statement(*_args: Any) -> None:
+    counter = _queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+async def _job_ids(limit: int = 500) -> list[int]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Job.id).where(Job.is_active.is_(True)).order_by(Job.id.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+def _scenarios(job_ids: list[int]) -> dict[str, Callable[[random.Random], str]]:
+    return {
+        "jobs": lambda r: f"/api/v1/jobs?page={r.randint(1, 20)}",
+        "jobs_search": lambda r: "/api/v1/jobs?q=python&sort=relevance",
+        "jobs_recommended": lambda r: "/api/v1/jobs?sort=recommended",
+        "job_detail": lambda r: f"/api/v1/jobs/{r.choice(job_ids)}",
+        "me": lambda r: "/api/v1/me",
+        "recruiter_applications": lambda r: "/api/v1/recruiter/applications?page_size=20",
+    }
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    path_for: Callable[[random.Random], str],
+    n: int,
+    concurrency: int,
+    seed: int,
+) -> dict[str, Any]:
+    rnd = random.Random(seed)
+    paths = [path_for(rnd) for _ in range(n)]
+    timings: list[float] = []
+    queries: list[int] = []
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(path: str) -> None:
+        nonlocal errors
+        async with sem:
+            counter = [0]
+            token = _queries.set(counter)
+            try:
+                t0 = time.perf_counter()
+                response = await client.get(path)
+                timings.append((time.perf_counter() - t0) * 1000)
+            finally:
+                _queries.reset(token)
+            queries.append(counter[0])
+            if response.status_code >= 400:
+                errors += 1
+
+    t_start = time.perf_counter()
+    await asyncio.gather(*(one(p) for p in paths))
+    elapsed = time.perf_counter() - t_start
+    timings.sort()
+    return {
+        "n": n,
+        "errors": errors,
+        "p50": _percentile(timings, 50),
+        "p95": _percentile(timings, 95),
+        "p99": _percentile(timings, 99),
+        "mean": statistics.mean(timings),
+        "rps": n / elapsed if elapsed else 0.0,
+        "queries": statistics.mean(queries),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    if not IS_DEVELOPMENT:
+        raise SystemExit("bench_api.py usa DEV_AUTH_BYPASS: rode com ENVIRONMENT=development.")
+    job_ids = await _job_ids()
+    if not job_ids:
+        raise SystemExit("Nenhuma vaga ativa: rode scripts/seed_perf_data.py antes.")
+    scenarios = _scenarios(job_ids)
+    selected = args.only or list(scenarios)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {DEV_AUTH_BYPASS_SECRET}"}
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers=headers
+        ) as client:
+            print(
+                f"{'cenário':<24}{'n':>6}{'erros':>7}{'p50 ms':>9}{'p95 ms':>9}"
+                f"{'p99 ms':>9}{'média':>9}{'req/s':>8}{'q/req':>7}"
+            )
+            for name in selected:
+                # Aquecimento: pool de conexões, caches de statements e de auth.
+                await _run_scenario(client, scenarios[name], args.warmup, args.concurrency, 0)
+                s = await _run_scenario(
+                    client, scenarios[name], args.n, args.concurrency, args.seed
+                )
+                print(
+                    f"{name:<24}{s['n']:>6}{s['errors']:>7}{s['p50']:>9.1f}{s['p95']:>9.1f}"
+                    f"{s['p99']:>9.1f}{s['mean']:>9.1f}{s['rps']:>8.0f}{s['queries']:>7.1f}"
+                )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count_statement)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=300, help="requests medidas por cenário")
+    parser.add_argument("-c", "--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20, help="requests de aquecimento")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=["jobs", "jobs_search", "jobs_recommended", "job_detail", "me",
+                 "recruiter_applications"],
+        help="roda só este cenário (repetível)",
+    )
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark de UserService.get_me: loader JSON (1 query) vs. hidratação ORM com selectinload.
+
+Run from repo root: uv run python scripts/bench_get_me.py --sub <api_users.id> [-n 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import Profile, User
+from app.services.user_service import UserService, _is_profile_complete
+from sqlalchemy import event, select
+from sqlalchemy.orm import selectinload
+
+_statements = 0
+
+
+def _count_statement(*_args: Any) -> None:
+    global _statements
+    _statements += 1
+
+
+async def orm_get_me(session, sub: str) -> dict[str, Any] | None:
+    """Caminho anterior de get_me: User + 3 selectinload + serialização em Python."""
+    result = await session.execute(
+        select(User)
+        .options(
+            selectinload(User.profile).selectinload(Profile.experiences),
+            selectinload(User.profile).selectinload(Profile.education_rows),
+            selectinload(User.profile).selectinload(Profile.tech_projects),
+        )
+        .where(User.id == sub)
+    )
+    user = result.scalar_one_or_none()
+    if not user:
+        return None
+    p = user.profile
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "username": (p.slug if p else None) or user.username,
+        "is_profile_complete": _is_profile_complete(
+            user.first_name, user.last_name, p.slug if p else None, user.username
+        ),
+        "is_active": user.is_active,
+        "legacy_user_id": user.legacy_user_id,
+        "profile": None
+        if not p
+        else {
+            "bio": p.bio,
+            "avatar_s3_key": p.avatar_s3_key,
+            "city": p.city,
+            "contact_info": p.contact_info,
+            "skills": p.skills,
+            "github_url": p.github_url,
+            "linkedin_url": p.linkedin_url,
+            "is_portfolio_public": p.is_portfolio_public,
+            "is_published": p.is_published,
+            "slug": p.slug,
+            "experiences": [
+                {
+                    "id": e.id,
+                    "company": e.company,
+                    "role": e.role,
+                    "start_date": e.start_date.isoformat(),
+                    "end_date": e.end_date.isoformat() if e.end_date else None,
+                    "description": e.description,
+                }
+                for e in sorted(p.experiences, key=lambda r: r.id)
+            ],
+            "education": [
+                {
+                    "id": ed.id,
+                    "institution": ed.institution,
+                    "course": ed.course,
+                    "status": ed.status,
+                    "start_date": ed.start_date.isoformat() if ed.start_date else None,
+                    "end_date": ed.end_date.isoformat() if ed.end_date else None,
+                }
+                for ed in sorted(p.education_rows, key=lambda r: r.id)
+            ],
+            "tech_projects": [
+                {
+                    "id": tp.id,
+                    "name": tp.name,
+                    "description": tp.description,
+                    "url": tp.url,
+                    "project_type": tp.project_type,
+                }
+                for tp in sorted(p.tech_projects, key=lambda r: r.id)
+            ],
+        },
+    }
+
+
+async def _measure(label: str, loader, sub: str, n: int) -> dict[str, Any] | None:
+    global _statements
+    timings: list[float] = []
+    _statements = 0
+    data = None
+    for _ in range(n):
+        # Sessão nova por iteração, como uma request (identity map vazio).
+        async with AsyncSessionLocal() as session:
+            t0 = time.perf_counter()
+            data = await loader(session, sub)
+            timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"{label:<6} mean={statistics.mean(timings):7.2f}ms "
+        f"p50={statistics.median(timings):7.2f}ms p95={p95:7.2f}ms "
+        f"queries/call={_statements / n:.1f}"
+    )
+    return data
+
+
+async def run(sub: str, n: int) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    try:
+        # Aquecimento: conexões do pool e caches de statements do asyncpg.
+        await _measure("warmup", orm_get_me, sub, 5)
+        orm = await _measure("orm", orm_get_me, sub, n)
+        fast = await _measure("json", lambda s, u: UserService(s).get_me(u), sub, n)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count_statement)
+        await engine.dispose()
+    print("respostas idênticas" if orm == fast else "ATENÇÃO: respostas diferentes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sub", required=True, help="api_users.id (Cognito sub)")
+    parser.add_argument("-n", type=int, default=200, help="chamadas por loader")
+    args = parser.parse_args()
+    asyncio.run(run(args.sub, args.n))
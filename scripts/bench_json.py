@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark da serialização de uma página de 100 vagas (GET /jobs?page_size=100), sem banco.
+
+Monta 100 vagas ORM em memória (empresa + tags), gera os itens com JobService._job_summary
+e compara o caminho anterior (datetimes viram string com .isoformat() no service, dict
+passa pelo jsonable_encoder do FastAPI e pelo json da stdlib) com o atual (datetime
+nativo, ORJSONResponse retornada direto pela rota). Mede também a resposta ASGI completa
+de uma rota mínima em cada modo.
+
+Run from repo root: uv run python scripts/bench_json.py [-n 2000] [--items 100]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from app.database.models import Company, Job, Tag
+from app.responses import ORJSONResponse
+from app.services.job_service import JobService
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def _jobs(n: int) -> list[Job]:
+    now = datetime.now(UTC)
+    tags = [
+        Tag(id=i, name=name)
+        for i, name in enumerate(
+            ["python", "fastapi", "postgresql", "aws", "react", "typescript", "docker", "remoto"]
+        )
+    ]
+    jobs = []
+    for i in range(n):
+        company = Company(
+            id=i % 25 + 1,
+            name=f"Empresa Exemplo {i % 25}",
+            logo_s3_key=f"companies/{i % 25}/logo.png",
+        )
+        jobs.append(
+            Job(
+                id=i + 1,
+                title=f"Pessoa Desenvolvedora Backend Python Sênior {i}",
+                salary_range="R$ 12.000 - R$ 16.000",
+                is_active=True,
+                created_at=now - timedelta(minutes=i),
+                company=company,
+                tags=tags[i % 3 : i % 3 + 5],
+            )
+        )
+    return jobs
+
+
+def _page(items: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "results": items,
+        "total": 12345,
+        "page": 1,
+        "page_size": len(items),
+        "next_cursor": "WyIyMDI2LTEwLTE3VDEyOjAwOjAwKzAwOjAwIiwxMjNd",
+        "has_more": True,
+    }
+
+
+def _legacy_items(svc: JobService, jobs: list[Job]) -> list[dict[str, Any]]:
+    items = []
+    for j in jobs:
+        row = svc._job_summary(j)
+        row["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+        items.append(row)
+    return items
+
+
+def _time(label: str, fn: Callable[[], Any], n: int) -> float:
+    for _ in range(min(100, n)):
+        fn()
+    timings = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1e6)
+    timings.sort()
+    mean = statistics.mean(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<44}{statistics.median(timings):>10.0f}{p95:>10.0f}{mean:>10.0f}")
+    return mean
+
+
+async def _asgi(n: int, jobs: list[Job]) -> None:
+    svc = JobService(None)  # _job_summary não usa a sessão
+    app = FastAPI()
+
+    # Sem anotação de retorno, como as rotas antigas: dict -> jsonable_encoder -> json.
+    @app.get("/legacy", response_class=JSONResponse)
+    async def legacy():
+        return _page(_legacy_items(svc, jobs))
+
+    @app.get("/orjson")
+    async def fast() -> ORJSONResponse:
+        return ORJSONResponse(_page([svc._job_summary(j) for j in jobs]))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy_body = (await client.get("/legacy")).json()
+        fast_body = (await client.get("/orjson")).json()
+        print(
+            "respostas idênticas" if legacy_body == fast_body else "ATENÇÃO: respostas diferentes"
+        )
+        for path in ("/legacy", "/orjson"):
+            timings = []
+            for _ in range(n):
+                t0 = time.perf_counter()
+                await client.get(path)
+                timings.append((time.perf_counter() - t0) * 1e6)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(
+                f"{'GET ' + path + ' (ASGI, itens + render)':<44}"
+                f"{statistics.median(timings):>10.0f}{p95:>10.0f}{statistics.mean(timings):>10.0f}"
+            )
+
+
+def run(n: int, items: int) -> None:
+    jobs = _jobs(items)
+    svc = JobService(None)  # _job_summary não usa a sessão
+    legacy_page = _page(_legacy_items(svc, jobs))
+    fast_page = _page([svc._job_summary(j) for j in jobs])
+
+    print(f"{items} vagas por página, {n} iterações (µs)")
+    print(f"{'etapa':<44}{'p50':>10}{'p95':>10}{'média':>10}")
+    before = _time(
+        "antes: jsonable_encoder + json (stdlib)",
+        lambda: JSONResponse(jsonable_encoder(legacy_page)).body,
+        n,
+    )
+    after = _time("depois: ORJSONResponse direto", lambda: ORJSONResponse(fast_page).body, n)
+    print(f"serialização {before / after:.1f}x mais rápida")
+    _time("itens antes (.isoformat() no service)", lambda: _legacy_items(svc, jobs), n)
+    _time("itens depois (datetime nativo)", lambda: [svc._job_summary(j) for j in jobs], n)
+    asyncio.run(_asgi(max(n // 4, 1), jobs))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=2000, help="iterações por variante")
+    parser.add_argument("--items", type=int, default=100, help="vagas por página")
+    args = parser.parse_args()
+    run(args.n, args.items)
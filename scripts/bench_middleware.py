@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Micro-benchmark do RequestIdMiddleware: ASGI puro vs. a versão antiga em BaseHTTPMiddleware.
+
+Sobe a mesma app mínima (sem banco) três vezes em uvicorn, numa porta local: sem
+middleware, com o middleware antigo (BaseHTTPMiddleware, mantido aqui só como referência)
+e com o atual (app.main.RequestIdMiddleware). Dispara requests HTTP reais (httpx) e
+reporta latência e o custo por request de cada middleware em relação à app sem middleware.
+Os dois middlewares fazem o mesmo trabalho (contextvars, Server-Timing, métricas, log).
+
+Run from repo root: uv run python scripts/bench_middleware.py [-n 3000] [-c 20]
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+import uvicorn
+from app.logging_config import QueryStats, query_stats_var, request_id_var
+from app.main import RequestIdMiddleware, record_request, server_timing
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    """RequestIdMiddleware antes da troca para ASGI puro (mesmo trabalho por request)."""
+
+    async def dispatch(self, request: Request, call_next):
+        req_id = (
+            request.headers.get("x-amzn-trace-id")
+            or request.headers.get("x-request-id")
+            or str(uuid.uuid4())[:8]
+        )
+        token = request_id_var.set(req_id)
+        stats = QueryStats(parent=query_stats_var.get())
+        stats_token = query_stats_var.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+            total_ms = (time.perf_counter() - started) * 1000
+            response.headers["X-Request-Id"] = req_id
+            response.headers["Server-Timing"] = server_timing(stats, total_ms)
+            record_request(request.scope, response.status_code, total_ms, stats)
+            return response
+        finally:
+            query_stats_var.reset(stats_token)
+            request_id_var.reset(token)
+
+
+def _build_app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, Any]:
+        return {"ok": True, "request_id": request_id_var.get()}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(10):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+async def _measure(app: FastAPI, path: str, n: int, concurrency: int) -> dict[str, float]:
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    timings: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+
+            async def one() -> None:
+                async with sem:
+                    t0 = time.perf_counter()
+                    response = await client.get(path)
+                    timings.append((time.perf_counter() - t0) * 1000)
+                    response.raise_for_status()
+
+            # Aquecimento: conexões keep-alive e caminhos quentes do interpretador.
+            await asyncio.gather(*(one() for _ in range(min(200, n))))
+            timings.clear()
+            t_start = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(n)))
+            elapsed = time.perf_counter() - t_start
+    finally:
+        server.should_exit = True
+        await serving
+
+    timings.sort()
+    return {
+        "p50": _percentile(timings, 50),
+        "p99": _percentile(timings, 99),
+        "mean": statistics.mean(timings),
+        "rps": n / elapsed if elapsed else 0.0,
+    }
+
+
+async def run(n: int, concurrency: int) -> None:
+    # O log de acesso por request iria para stderr e dominaria a medição.
+    logging.getLogger("app.main").setLevel(logging.WARNING)
+    variants = {
+        "sem middleware": None,
+        "BaseHTTPMiddleware": LegacyRequestIdMiddleware,
+        "ASGI puro": RequestIdMiddleware,
+    }
+    print(
+        f"{'rota':<9}{'variante':<20}{'p50 ms':>9}{'p99 ms':>9}{'média':>9}{'req/s':>8}"
+        f"{'custo/req':>11}"
+    )
+    for path in ("/ping", "/stream"):
+        baseline = None
+        for label, middleware in variants.items():
+            s = await _measure(_build_app(middleware), path, n, concurrency)
+            if baseline is None:
+                baseline = s
+                overhead = "-"
+            else:
+                # Custo por request = diferença de tempo de serviço (1/throughput).
+                extra_us = (1 / s["rps"] - 1 / baseline["rps"]) * 1e6
+                overhead = f"{extra_us:+.0f} µs"
+            print(
+                f"{path:<9}{label:<20}{s['p50']:>9.2f}{s['p99']:>9.2f}{s['mean']:>9.2f}"
+                f"{s['rps']:>8.0f}{overhead:>11}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=3000, help="requests medidas por variante")
+    parser.add_argument("-c", "--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.n, args.concurrency))
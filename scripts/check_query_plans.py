@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Regressão de planos: EXPLAIN nas queries quentes dos services; falha se houver Seq Scan.
+
+Executa os métodos de JobService/ApplicationService/CompanyService contra o banco
+configurado (DATABASE_URL, já migrado e com massa de scripts/seed_perf_data.py), captura o SQL
+emitido e roda EXPLAIN de cada statement com enable_seqscan=off. Com seq scan desligado
+o planner só escolhe Seq Scan quando nenhum índice serve, então qualquer Seq Scan no
+plano indica índice faltando (ou query que deixou de usá-lo).
+
+Run from repo root: uv run python scripts/check_query_plans.py [-v] [--allow api_tags]
+Exit code: 0 = ok, 1 = Seq Scan encontrado, 2 = banco sem dados de amostra.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import Application, Company, Job, JobTag, Profile, Tag
+from app.services.application_service import ApplicationService
+from app.services.company_service import CompanyService
+from app.services.job_service import JobService
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Case = tuple[str, Callable[[AsyncSession], Awaitable[Any]]]
+
+_captured: list[tuple[str, str, Any]] = []
+_label = "-"
+
+
+def _capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+    if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        _captured.append((_label, statement, parameters))
+
+
+async def _samples(session: AsyncSession) -> dict[str, Any] | None:
+    """Valores reais do banco para parametrizar as queries (dono com mais vagas etc.)."""
+    owner = await session.scalar(
+        select(Company.owner_id)
+        .join(Job, Job.company_id == Company.id)
+        .group_by(Company.owner_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    applicant = await session.scalar(
+        select(Application.user_id)
+        .group_by(Application.user_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    if owner is None or applicant is None:
+        return None
+    company_id = await session.scalar(
+        select(Company.id).where(Company.owner_id == owner).order_by(Company.id).limit(1)
+    )
+    tag = await session.scalar(
+        select(Tag.name)
+        .join(JobTag, JobTag.tag_id == Tag.id)
+        .group_by(Tag.name)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    title = await session.scalar(select(Job.title).order_by(Job.id.desc()).limit(1))
+    skills = await session.scalar(select(Profile.skill_list).where(Profile.user_id == applicant))
+    return {
+        "owner": owner,
+        "applicant": applicant,
+        "company_id": company_id,
+        "tag": tag or "python",
+        "q": (title or "desenvolvedor").split()[0],
+        "skills": list(skills or [])[:2] or [tag or "python"],
+    }
+
+
+def _cases(s: dict[str, Any]) -> list[Case]:
+    async def jobs_cursor(session: AsyncSession) -> None:
+        svc = JobService(session)
+        first = await svc.list_public(None, None, 1, 20, include_total="false")
+        if first.next_cursor:
+            await svc.list_public(None, None, 1, 20, cursor=first.next_cursor)
+
+    async def inbox_cursor(session: AsyncSession) -> None:
+        svc = ApplicationService(session)
+        first = await svc.list_for_recruiter(s["owner"], None, None, None, 1, 20)
+        if first.next_cursor:
+            await svc.list_for_recruiter(
+                s["owner"], None, None, None, 1, 20, cursor=first.next_cursor
+            )
+
+    return [
+        ("jobs recent", lambda db: JobService(db).list_public(None, None, 1, 20)),
+        ("jobs cursor", jobs_cursor),
+        ("jobs tag", lambda db: JobService(db).list_public(None, s["tag"], 1, 20)),
+        (
+            "jobs search",
+            lambda db: JobService(db).list_public(s["q"], None, 1, 20, sort="relevance"),
+        ),
+        (
+            "jobs company",
+            lambda db: JobService(db).list_public(None, None, 1, 20, company_id=s["company_id"]),
+        ),
+        (
+            "jobs recommended",
+            lambda db: JobService(db).list_public(
+                None, None, 1, 20, sort="recommended", viewer_id=s["applicant"]
+            ),
+        ),
+        (
+            "dashboard recommended",
+            lambda db: JobService(db)._recommended_for_user(s["applicant"], 3),
+        ),
+        ("recruiter jobs", lambda db: JobService(db).list_recruiter(s["owner"])),
+        (
+            "my applications",
+            lambda db: ApplicationService(db).list_mine(s["applicant"], None, 1, 20),
+        ),
+        ("recruiter inbox", inbox_cursor),
+        (
+            "recruiter inbox status",
+            lambda db: ApplicationService(db).list_for_recruiter(
+                s["owner"], None, s["company_id"], "applied", 1, 20
+            ),
+        ),
+        (
+            "recruiter candidates",
+            lambda db: ApplicationService(db).search_candidates(
+                s["owner"], None, None, None, s["skills"], None, None, None, 1, 20
+            ),
+        ),
+        ("companies", lambda db: CompanyService(db).list_public(None, 1, 20)),
+        ("companies search", lambda db: CompanyService(db).list_public(s["q"], 1, 20)),
+    ]
+
+
+def _seq_scans(node: dict[str, Any]) -> list[str]:
+    found = []
+    if node.get("Node Type") == "Seq Scan":
+        found.append(node.get("Relation Name", "?"))
+    for child in node.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def run(verbose: bool, allow: set[str]) -> int:
+    global _label
+    async with AsyncSessionLocal() as session:
+        samples = await _samples(session)
+    if samples is None:
+        print("Banco sem vagas/candidaturas: rode scripts/seed_perf_data.py antes.")
+        await engine.dispose()
+        return 2
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        for label, case in _cases(samples):
+            _label = label
+            async with AsyncSessionLocal() as session:
+                await case(session)
+                await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+
+    failures = 0
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for label, statement, parameters in _captured:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            scans = [t for t in _seq_scans(plan[0]["Plan"]) if t not in allow]
+            if scans:
+                failures += 1
+                print(f"FALHA [{label}] Seq Scan em {', '.join(sorted(set(scans)))}")
+                print(f"  {' '.join(statement.split())}")
+            elif verbose:
+                print(f"ok    [{label}] {' '.join(statement.split())[:120]}")
+        await conn.rollback()
+    await engine.dispose()
+
+    print(f"{len(_captured)} statements verificados, {failures} com Seq Scan.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-v", "--verbose", action="store_true", help="lista também os ok")
+    parser.add_argument(
+        "--allow",
+        action="append",
+        default=[],
+        metavar="TABLE",
+        help="tabela em que Seq Scan é aceitável (repetível)",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.verbose, set(args.allow))))
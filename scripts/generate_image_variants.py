@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Gera as variantes WebP (thumb, medium) dos logos de empresa e avatares já enviados.
+
+Idempotente: variantes existentes são puladas (use --force para regerar). Precisa do
+extra `images` (uv sync --extra images) e das credenciais do bucket.
+
+Run from repo root: uv run python scripts/generate_image_variants.py [-c 4] [--force]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import Company, Profile
+from app.services.image_variants import generate_variants, is_variant_source, shutdown_executor
+from sqlalchemy import select
+
+
+async def _keys() -> list[str]:
+    async with AsyncSessionLocal() as session:
+        logos = await session.scalars(
+            select(Company.logo_s3_key).where(Company.logo_s3_key.is_not(None))
+        )
+        avatars = await session.scalars(
+            select(Profile.avatar_s3_key).where(Profile.avatar_s3_key.is_not(None))
+        )
+        keys = {*logos, *avatars}
+    return sorted(k for k in keys if is_variant_source(k))
+
+
+async def run(concurrency: int, force: bool) -> None:
+    keys = await _keys()
+    await engine.dispose()
+    print(f"{len(keys)} imagens encontradas.")
+    sem = asyncio.Semaphore(concurrency)
+    counts = {"criadas": 0, "ok": 0, "falhas": 0}
+
+    async def one(s3_key: str) -> None:
+        async with sem:
+            try:
+                result = await generate_variants(s3_key, force=force)
+            except LookupError:
+                counts["falhas"] += 1
+                print(f"  original não encontrado: {s3_key}")
+                return
+            except Exception as e:
+                counts["falhas"] += 1
+                print(f"  erro em {s3_key}: {e}")
+                return
+        counts["criadas" if result["created"] else "ok"] += 1
+
+    try:
+        await asyncio.gather(*(one(k) for k in keys))
+    finally:
+        shutdown_executor()
+    print(
+        f"Sucesso: {counts['criadas']} com variantes geradas, {counts['ok']} já completas, "
+        f"{counts['falhas']} falhas."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("--force", action="store_true", help="regera variantes existentes")
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.force))
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Recalcula api_companies.active_jobs_count (run from repo root:
+uv run python scripts/reconcile_company_counts.py)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.services.company_service import CompanyService
+
+
+async def run() -> None:
+    async with AsyncSessionLocal() as session:
+        fixed = await CompanyService(session).reconcile_active_jobs_counts()
+        await session.commit()
+    print(f"Sucesso: {fixed} empresas com active_jobs_count corrigido.")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Massa sintética para medir performance localmente (COPY via asyncpg).
+
+Gera usuários/perfis (com experiências e formações), empresas, vagas com tags, índice de
+skills e candidaturas em volume configurável. O usuário de desenvolvimento (DEV_USER_SUB,
+o mesmo do DEV_AUTH_BYPASS) recebe empresas, vagas com candidatos e candidaturas próprias,
+para que /me, /recruiter/applications e /dashboard tenham dados ao rodar
+scripts/bench_api.py.
+
+Run from repo root (banco migrado; nunca em produção):
+    uv run python scripts/seed_perf_data.py --users 50000 --jobs 20000 --applications 1000000
+    uv run python scripts/seed_perf_data.py --reset   # remove só as linhas geradas
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+# Allow running without installing as package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import Job
+from app.services.company_service import CompanyService
+from app.services.job_service import refresh_job_search_vectors
+from app.skills import job_skills, normalize_skill
+from app.tech_list import TECH_LIST
+
+# Prefixo dos ids gerados: --reset apaga só o que este script criou.
+PERF_PREFIX = "perf-"
+CNPJ_BASE = 90_000_000_000_000
+CHUNK = 50_000
+
+CITIES = [
+    "São Paulo", "Rio de Janeiro", "Belo Horizonte", "Recife", "Salvador", "Fortaleza",
+    "Porto Alegre", "Curitiba", "Florianópolis", "Brasília", "Manaus", "Goiânia",
+]
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela", "Henrique", "Iara",
+    "João", "Karina", "Lucas", "Marina", "Nicolas", "Olívia", "Pedro", "Raquel", "Tiago",
+]
+LAST_NAMES = [
+    "Silva", "Souza", "Oliveira", "Santos", "Lima", "Pereira", "Costa", "Almeida",
+    "Ferreira", "Rodrigues", "Gomes", "Martins", "Araújo", "Barbosa", "Ribeiro",
+]
+ROLES = ["Desenvolvedor(a)", "Engenheiro(a) de Software", "Analista", "Cientista de Dados"]
+LEVELS = ["Júnior", "Pleno", "Sênior", "Especialista"]
+STATUSES = ["applied"] * 6 + ["interviewing"] * 2 + ["approved", "rejected"]
+EDUCATION_STATUSES = ["completed", "completed", "in_progress"]
+
+
+def _rows(n: int, make) -> Iterator[tuple]:
+    for i in range(n):
+        yield make(i)
+
+
+def _chunks(records: Iterable[tuple], size: int = CHUNK) -> Iterator[list[tuple]]:
+    batch: list[tuple] = []
+    for r in records:
+        batch.append(r)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _copy(conn, table: str, columns: list[str], records: Iterable[tuple]) -> int:
+    total = 0
+    for batch in _chunks(records):
+        await conn.copy_records_to_table(table, records=batch, columns=columns)
+        total += len(batch)
+    print(f"  {table}: {total} linhas")
+    return total
+
+
+async def _next_id(conn, table: str) -> int:
+    return int(await conn.fetchval(f"SELECT coalesce(max(id), 0) + 1 FROM {table}"))
+
+
+async def _sync_sequence(conn, table: str) -> None:
+    await conn.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"(SELECT coalesce(max(id), 1) FROM {table}))"
+    )
+
+
+async def reset(conn) -> None:
+    # CASCADE das FKs remove perfis, portfólio, vagas (com tags, skills e candidaturas).
+    await conn.execute(
+        "DELETE FROM api_companies WHERE website = 'perf' AND name LIKE 'Empresa Perf %'"
+    )
+    await conn.execute(f"DELETE FROM api_users WHERE id LIKE '{PERF_PREFIX}%'")
+
+
+async def seed(conn, args: argparse.Namespace) -> None:
+    rnd = random.Random(args.seed)
+    now = datetime.now(UTC)
+    dev_sub = os.environ.get("DEV_USER_SUB", "dev-local-user")
+    dev_email = os.environ.get("DEV_USER_EMAIL", "dev@example.com")
+    if await conn.fetchval(f"SELECT 1 FROM api_users WHERE id LIKE '{PERF_PREFIX}%' LIMIT 1"):
+        raise SystemExit("Já existem dados perf-*: rode com --reset antes.")
+
+    print("tags")
+    await conn.executemany(
+        "INSERT INTO api_tags (name) VALUES ($1) ON CONFLICT DO NOTHING",
+        [(t,) for t in TECH_LIST],
+    )
+    tags = await conn.fetch("SELECT id, name FROM api_tags")
+    tag_ids = [r["id"] for r in tags]
+    tag_name = {r["id"]: r["name"] for r in tags}
+
+    print("usuários")
+    await conn.execute(
+        """
+        INSERT INTO api_users (id, email, first_name, last_name, username, is_active)
+        VALUES ($1, $2, 'Dev', 'Local', NULL, true) ON CONFLICT (id) DO NOTHING
+        """,
+        dev_sub,
+        dev_email,
+    )
+    user_ids = [f"{PERF_PREFIX}{i:08d}" for i in range(args.users)]
+
+    def user_row(i: int) -> tuple:
+        first, last = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+        return (user_ids[i], f"{user_ids[i]}@example.com", first, last, user_ids[i], True)
+
+    await _copy(
+        conn,
+        "api_users",
+        ["id", "email", "first_name", "last_name", "username", "is_active"],
+        _rows(args.users, user_row),
+    )
+
+    def profile_row(i: int) -> tuple:
+        skills = rnd.sample(TECH_LIST, rnd.randint(0, 8))
+        return (
+            user_ids[i],
+            "",
+            rnd.choice(CITIES),
+            "",
+            ", ".join(skills),
+            [normalize_skill(s) for s in skills],
+            "",
+            "",
+            rnd.random() < 0.5,
+            rnd.random() < 0.3,
+            user_ids[i],
+        )
+
+    await _copy(
+        conn,
+        "api_profiles",
+        [
+            "user_id", "bio", "city", "contact_info", "skills", "skill_list", "github_url",
+            "linkedin_url", "is_portfolio_public", "is_published", "slug",
+        ],
+        _rows(args.users, profile_row),
+    )
+
+    def experience_rows() -> Iterator[tuple]:
+        for uid in user_ids:
+            for _ in range(rnd.randint(0, 3)):
+                start = date.today() - timedelta(days=rnd.randint(90, 365 * 12))
+                end = start + timedelta(days=rnd.randint(60, 365 * 4))
+                yield (
+                    uid,
+                    f"Empresa {rnd.randint(1, 5000)}",
+                    rnd.choice(ROLES),
+                    start,
+                    None if end > date.today() else end,
+                    "",
+                )
+
+    await _copy(
+        conn,
+        "api_professional_experiences",
+        ["profile_user_id", "company", "role", "start_date", "end_date", "description"],
+        experience_rows(),
+    )
+
+    def education_rows() -> Iterator[tuple]:
+        for uid in user_ids:
+            for _ in range(rnd.randint(0, 2)):
+                yield (uid, "Universidade Federal", "Ciência da Computação",
+                       rnd.choice(EDUCATION_STATUSES))
+
+    await _copy(
+        conn,
+        "api_education",
+        ["profile_user_id", "institution", "course", "status"],
+        education_rows(),
+    )
+
+    print("empresas")
+    first_company = await _next_id(conn, "api_companies")
+    n_dev = max(1, args.companies // 100)
+
+    def company_row(i: int) -> tuple:
+        owner = dev_sub if i < n_dev else rnd.choice(user_ids)
+        digits = f"{CNPJ_BASE + first_company + i:014d}"
+        cnpj = f"{digits[:2]}.{digits[2:5]}.{digits[5:8]}/{digits[8:12]}-{digits[12:]}"
+        return (first_company + i, f"Empresa Perf {first_company + i}", cnpj, "perf",
+                "Empresa gerada para testes de carga.", owner)
+
+    await _copy(
+        conn,
+        "api_companies",
+        ["id", "name", "cnpj", "website", "description", "owner_id"],
+        _rows(args.companies, company_row),
+    )
+    await _sync_sequence(conn, "api_companies")
+
+    print("vagas")
+    first_job = await _next_id(conn, "api_jobs")
+    job_tags: dict[int, list[int]] = {}
+    job_created: list[datetime] = []
+    job_skill_rows: list[tuple] = []
+
+    def job_row(i: int) -> tuple:
+        job_id = first_job + i
+        techs = rnd.sample(TECH_LIST, 3)
+        requirements = f"Experiência com {techs[0]}, {techs[1]} e {techs[2]}."
+        job_tags[job_id] = rnd.sample(tag_ids, rnd.randint(2, 5))
+        job_skill_rows.extend(
+            (job_id, s[:100])
+            for s in job_skills(requirements, [tag_name[t] for t in job_tags[job_id]])
+        )
+        created = now - timedelta(seconds=rnd.randint(0, 365 * 86400))
+        job_created.append(created)
+        # O primeiro 1% das vagas fica nas empresas do usuário dev.
+        if i < args.jobs // 100:
+            company = first_company + i % n_dev
+        else:
+            company = first_company + rnd.randrange(args.companies)
+        return (
+            job_id,
+            company,
+            f"{rnd.choice(ROLES)} {techs[0]} {rnd.choice(LEVELS)}",
+            f"Vaga para atuar com {techs[0]} em time de produto. " * 5,
+            requirements,
+            f"R$ {rnd.randint(3, 25)} mil",
+            rnd.random() < 0.85,
+            created,
+            created,
+        )
+
+    await _copy(
+        conn,
+        "api_jobs",
+        [
+            "id", "company_id", "title", "description", "requirements", "salary_range",
+            "is_active", "created_at", "updated_at",
+        ],
+        _rows(args.jobs, job_row),
+    )
+    await _sync_sequence(conn, "api_jobs")
+    await _copy(
+        conn,
+        "api_job_tags",
+        ["job_id", "tag_id"],
+        ((jid, tid) for jid, tids in job_tags.items() for tid in tids),
+    )
+    await _copy(conn, "api_job_skills", ["job_id", "skill"], job_skill_rows)
+
+    print("candidaturas")
+    n_users, n_jobs = len(user_ids), args.jobs
+    target = min(args.applications, n_users * n_jobs)
+    seen: set[int] = set()
+
+    def application_rows() -> Iterator[tuple]:
+        while len(seen) < target:
+            u, j = rnd.randrange(n_users), rnd.randrange(n_jobs)
+            # As primeiras vagas são do usuário dev: concentra parte dos candidatos nelas.
+            if rnd.random() < 0.05:
+                j = rnd.randrange(max(1, n_jobs // 100))
+            pair = u * n_jobs + j
+            if pair in seen:
+                continue
+            seen.add(pair)
+            created = job_created[j] + timedelta(seconds=rnd.randint(0, 30 * 86400))
+            created = min(created, now)
+            yield (user_ids[u], first_job + j, rnd.choice(STATUSES), "", "", "", created,
+                   created)
+        # Candidaturas do próprio usuário dev (GET /applications, /me/dashboard).
+        for j in rnd.sample(range(n_jobs // 100, n_jobs), min(50, n_jobs - n_jobs // 100)):
+            yield (dev_sub, first_job + j, "applied", "", "", "perf", now, now)
+
+    await _copy(
+        conn,
+        "api_applications",
+        [
+            "user_id", "job_id", "status", "rejection_reason", "feedback_text",
+            "cover_letter", "created_at", "updated_at",
+        ],
+        application_rows(),
+    )
+    await _sync_sequence(conn, "api_applications")
+
+
+async def run(args: argparse.Namespace) -> None:
+    t0 = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        sa_conn = await session.connection()
+        raw = await sa_conn.get_raw_connection()
+        conn = raw.driver_connection  # asyncpg.Connection (COPY nativo)
+        if args.reset:
+            await reset(conn)
+            await session.commit()
+            print(f"Dados perf removidos em {time.perf_counter() - t0:.1f}s.")
+            await engine.dispose()
+            return
+        first_job = int(await conn.fetchval("SELECT coalesce(max(id), 0) FROM api_jobs"))
+        await seed(conn, args)
+
+        print("índices derivados (search_vector, active_jobs_count)")
+        await refresh_job_search_vectors(session, Job.id > first_job)
+        await CompanyService(session).reconcile_active_jobs_counts()
+        await conn.execute("ANALYZE")
+        await session.commit()
+    await engine.dispose()
+    print(f"Concluído em {time.perf_counter() - t0:.1f}s.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--companies", type=int, default=1_000)
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--applications", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42, help="semente do gerador aleatório")
+    parser.add_argument("--reset", action="store_true", help="remove os dados gerados")
+    args = parser.parse_args()
+    if not args.reset and min(args.users, args.companies, args.jobs) < 1:
+        parser.error("--users, --companies e --jobs precisam ser >= 1")
+    asyncio.run(run(args))